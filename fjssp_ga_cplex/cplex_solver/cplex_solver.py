@@ -56,69 +56,105 @@ def load_data_from_excel(file_path: str):
     return numJ, numO, numM, J, O, Mset, JOSet, P, A
 
 
+def eligible_machines(J: List[int], O: List[int], Mset: List[int],
+                      A: Dict[Tuple[int,int,int], int]) -> Dict[Tuple[int,int], List[int]]:
+    return {(j, o): [m for m in Mset if A.get((j, o, m), 0) == 1] for j in J for o in O}
+
+
 def build_model(numJ: int, numO: int, numM: int,
                 J: List[int], O: List[int], Mset: List[int], JOSet: List[Tuple[int,int]],
                 P: Dict[Tuple[int,int], float], A: Dict[Tuple[int,int,int], int],
                 bigM: float = 1e7):
+    """Build the MIP over eligible assignments only.
+
+    ``Z`` exists only for (j, o, m) with ``A == 1`` and ``X`` only for job
+    pairs that share an eligible machine at the same operation, so the model
+    grows with the instance's flexibility instead of J^2*O*M. Each unordered
+    pair gets one antisymmetry row, one covering row (if both are on ``m``
+    one must precede the other) and the two big-M no-overlap rows.
+    """
     mdl = Model(name='FJSSP_MIP_from_OPL')
 
+    elig = eligible_machines(J, O, Mset, A)
+    for (j, o), ms in elig.items():
+        if not ms:
+            raise ValueError(f"No eligible machine for (j={j}, o={o})")
+
     S  = mdl.continuous_var_dict(JOSet, lb=0, name='S')
     C  = mdl.continuous_var_dict(JOSet, lb=0, name='C')
     Co = mdl.continuous_var_dict(J, lb=0, name='Co')
     Cmax = mdl.continuous_var(lb=0, name='Cmax')
 
-    Z = {}
-    for j in J:
-        for o in O:
-            for m in Mset:
-                Z[(j,o,m)] = mdl.binary_var(name=f"Z_{j}_{o}_{m}")
+    z_keys = [(j, o, m) for (j, o) in JOSet for m in elig[(j, o)]]
+    Z = mdl.binary_var_dict(z_keys, name=lambda k: "Z_%d_%d_%d" % k)
 
-    X = {}
-    for i in J:
-        for j in J:
-            if i == j:
-                continue
-            for o in O:
-                for m in Mset:
-                    X[(i, j, o, m)] = mdl.binary_var(name=f"X_{i}_{j}_{o}_{m}")
+    # Unordered pairs (i < j) sharing machine m at operation o.
+    pair_keys = []
+    for o in O:
+        for idx, i in enumerate(J):
+            mi = set(elig[(i, o)])
+            for j in J[idx + 1:]:
+                for m in elig[(j, o)]:
+                    if m in mi:
+                        pair_keys.append((i, j, o, m))
+    x_keys = [k for (i, j, o, m) in pair_keys for k in ((i, j, o, m), (j, i, o, m))]
+    X = mdl.binary_var_dict(x_keys, name=lambda k: "X_%d_%d_%d_%d" % k)
 
     mdl.minimize(Cmax)
 
-    for (j, o) in JOSet:
-        mdl.add_constraint(C[(j, o)] == S[(j, o)] + P[(j, o)], ctname=f"comp_time_{j}_{o}")
-
-    for j in J:
-        mdl.add_constraint(Co[j] >= C[(j, numO)], ctname=f"job_completion_{j}")
-        mdl.add_constraint(Cmax >= Co[j], ctname=f"makespan_ge_{j}")
+    mdl.add_constraints(
+        [C[(j, o)] == S[(j, o)] + P[(j, o)] for (j, o) in JOSet],
+        ["comp_time_%d_%d" % (j, o) for (j, o) in JOSet],
+    )
+    mdl.add_constraints(
+        [Co[j] >= C[(j, numO)] for j in J],
+        ["job_completion_%d" % j for j in J],
+    )
+    mdl.add_constraints(
+        [Cmax >= Co[j] for j in J],
+        ["makespan_ge_%d" % j for j in J],
+    )
+    prec = [(j, o) for j in J for o in O if o < numO]
+    mdl.add_constraints(
+        [C[(j, o)] <= S[(j, o + 1)] for (j, o) in prec],
+        ["precedence_%d_%d" % (j, o) for (j, o) in prec],
+    )
+    mdl.add_constraints(
+        [mdl.sum(Z[(j, o, m)] for m in elig[(j, o)]) == 1 for (j, o) in JOSet],
+        ["assign_one_%d_%d" % (j, o) for (j, o) in JOSet],
+    )
 
-    for j in J:
-        for o in O:
-            if o < numO:
-                mdl.add_constraint(C[(j, o)] <= S[(j, o + 1)], ctname=f"precedence_{j}_{o}")
-
-    for (j, o) in JOSet:
-        mdl.add_constraint(
-            mdl.sum(Z[(j,o,m)] for m in Mset if A[(j,o,m)] == 1) == 1,
-            ctname=f"assign_one_{j}_{o}"
-        )
-        for m in Mset:
-            mdl.add_constraint(Z[(j,o,m)] <= A[(j,o,m)], ctname=f"elig_{j}_{o}_{m}")
-
-    for i in J:
-        for j in J:
-            if i == j:
-                continue
-            for o in O:
-                for m in Mset:
-                    mdl.add_constraint(X[(i,j,o,m)] <= Z[(i,o,m)], ctname=f"linkZ1_{i}_{j}_{o}_{m}")
-                    mdl.add_constraint(X[(i,j,o,m)] <= Z[(j,o,m)], ctname=f"linkZ2_{i}_{j}_{o}_{m}")
-                    mdl.add_constraint(X[(i, j, o, m)] + X[(j, i, o, m)] <= 1, ctname=f"antisym_{i}_{j}_{o}_{m}")
-                    mdl.add_constraint(S[(j, o)] >= C[(i, o)] - bigM * (1 - X[(i, j, o, m)]), ctname=f"noovl1_{i}_{j}_{o}_{m}")
-                    mdl.add_constraint(S[(i, o)] >= C[(j, o)] - bigM * (1 - X[(j, i, o, m)]), ctname=f"noovl2_{i}_{j}_{o}_{m}")
+    cts, names = [], []
+    for (i, j, o, m) in pair_keys:
+        xij, xji = X[(i, j, o, m)], X[(j, i, o, m)]
+        zi, zj = Z[(i, o, m)], Z[(j, o, m)]
+        tag = "%d_%d_%d_%d" % (i, j, o, m)
+        cts += [
+            xij <= zi, xij <= zj, xji <= zi, xji <= zj,
+            xij + xji <= 1,
+            xij + xji >= zi + zj - 1,
+            S[(j, o)] >= C[(i, o)] - bigM * (1 - xij),
+            S[(i, o)] >= C[(j, o)] - bigM * (1 - xji),
+        ]
+        names += [
+            "linkZ1_" + tag, "linkZ2_" + tag, "linkZ1r_" + tag, "linkZ2r_" + tag,
+            "antisym_" + tag, "order_" + tag, "noovl1_" + tag, "noovl2_" + tag,
+        ]
+    if cts:
+        mdl.add_constraints(cts, names)
 
     return mdl, S, C, Co, Cmax, X, Z
 
 
+def model_size(mdl: Model) -> Dict[str, int]:
+    return {
+        'variables': mdl.number_of_variables,
+        'binary': mdl.number_of_binary_variables,
+        'continuous': mdl.number_of_continuous_variables,
+        'constraints': mdl.number_of_constraints,
+    }
+
+
 def _to_ga_formats(numJ, numO, J, O, Mset, P, Zvals, Svals):
     machines_chosen = {o: [None]*len(J) for o in O}
     for j in J:
@@ -148,6 +184,96 @@ def _to_ga_formats(numJ, numO, J, O, Mset, P, Zvals, Svals):
     return machines_chosen, processing_times_ga, chromosome
 
 
+def _schedule_from_initial(file_path, initial):
+    """Normalize ``initial`` to ``{(j, o): (machine, start)}``.
+
+    ``initial`` is a GA chromosome or a ``get_operation_details`` schedule.
+    A fixed-routing chromosome (gene strings or the integer ids returned by
+    ``ga_optimize``) is decoded with the GA's own reader, i.e. on the first
+    eligible machine of every operation. A chromosome twice that long is a
+    ``ga_optimize(flexible=True)`` one and is decoded with its own machine
+    assignment.
+    """
+    initial = list(initial)
+    if not initial:
+        raise ValueError("initial solution is empty")
+    if not isinstance(initial[0], (tuple, list)):
+        from ga.io import read_parameters_from_excel
+        from ga.instance import compile_instance
+        from ga.schedule import get_operation_details
+
+        machines, processing_times, _ = read_parameters_from_excel(file_path)
+        instance = compile_instance(machines, processing_times)
+        if not isinstance(initial[0], str) and len(initial) == 2 * instance.num_operations:
+            from ga.io import read_flexible_parameters
+            from ga.flexible import compile_flexible_instance, flexible_operation_details
+
+            flexible = compile_flexible_instance(*read_flexible_parameters(file_path))
+            initial = flexible_operation_details(initial, flexible)
+        else:
+            initial = get_operation_details(instance.encode(initial), instance)
+
+    from ga.gene import parse_gene
+
+    schedule = {}
+    for gene, machine, start, *_ in initial:
+        j, o = parse_gene(gene)
+        schedule[(j, o)] = (int(machine), float(start))
+    return schedule
+
+
+def _retime(schedule, J, O, P):
+    """Earliest start times keeping the assignment and per-machine order of ``schedule``.
+
+    The MIP only sequences operations with the same index ``o`` on a
+    machine, so operations are timed level by level: each waits for its
+    job's previous operation and for the one before it on its machine at
+    this level. The result satisfies every model constraint even when the
+    source schedule was decoded with different rules.
+    """
+    S, C = {}, {}
+    for o in O:
+        free = {}
+        for j in sorted(J, key=lambda j: (schedule[(j, o)][1], j)):
+            m = schedule[(j, o)][0]
+            s = max(C.get((j, o - 1), 0.0), free.get(m, 0.0))
+            S[(j, o)] = s
+            C[(j, o)] = s + P[(j, o)]
+            free[m] = C[(j, o)]
+    return S, C
+
+
+def add_warm_start(mdl: Model, S, C, Co, Cmax, X, Z, schedule, J, O, P):
+    """Register a complete MIP start (S, C, Co, Cmax, Z, X) built from ``schedule``.
+
+    Returns the start's makespan.
+    """
+    Svals, Cvals = _retime(schedule, J, O, P)
+    numO = max(O)
+    cmax = max(Cvals[(j, numO)] for j in J)
+
+    warm = mdl.new_solution()
+    for k in S:
+        warm.add_var_value(S[k], Svals[k])
+        warm.add_var_value(C[k], Cvals[k])
+    for j in J:
+        warm.add_var_value(Co[j], Cvals[(j, numO)])
+    warm.add_var_value(Cmax, cmax)
+    for (j, o) in S:
+        if (j, o, schedule[(j, o)][0]) not in Z:
+            raise ValueError(f"Machine {schedule[(j, o)][0]} is not eligible for (j={j}, o={o})")
+    for (j, o, m), var in Z.items():
+        warm.add_var_value(var, 1 if schedule[(j, o)][0] == m else 0)
+    # X follows the (source start, job) order _retime sequenced by; re-timed
+    # starts can tie (zero durations), which would leave both X at 0.
+    for (i, j, o, m), var in X.items():
+        both = schedule[(i, o)][0] == m and schedule[(j, o)][0] == m
+        first = (schedule[(i, o)][1], i) < (schedule[(j, o)][1], j)
+        warm.add_var_value(var, 1 if both and first else 0)
+    mdl.add_mip_start(warm)
+    return cmax
+
+
 def solve_and_extract(mdl: Model, S, C, Co, Cmax, X, Z):
     sol = mdl.solve(log_output=True)
     if sol is None:
@@ -168,10 +294,36 @@ def solve_and_extract(mdl: Model, S, C, Co, Cmax, X, Z):
     return result
 
 
-def solve_from_excel(file_path: str, bigM: float = 1e7):
+def solve_from_excel(file_path: str, bigM: float = 1e7, initial=None):
+    """Solve the workbook's MIP, optionally warm-started from ``initial``.
+
+    ``initial`` may be a GA chromosome (gene strings or integer ids from
+    ``ga_optimize``, with or without ``flexible=True``) or a
+    ``get_operation_details`` schedule. It is re-timed
+    into a feasible MIP start; its makespan then bounds ``Cmax`` and replaces
+    ``bigM`` when smaller, which tightens every no-overlap row.
+    """
     numJ, numO, numM, J, O, Mset, JOSet, P, A = load_data_from_excel(file_path)
+    schedule = upper = None
+    if initial is not None:
+        schedule = _schedule_from_initial(file_path, initial)
+        missing = [k for k in JOSet if k not in schedule]
+        if missing:
+            raise ValueError(f"initial solution misses operation (j={missing[0][0]}, o={missing[0][1]})")
+        upper = max(_retime(schedule, J, O, P)[1].values())
+        bigM = min(bigM, upper)
+
     mdl, S, C, Co, Cmax, X, Z = build_model(numJ, numO, numM, J, O, Mset, JOSet, P, A, bigM=bigM)
+    if schedule is not None:
+        Cmax.ub = upper
+        add_warm_start(mdl, S, C, Co, Cmax, X, Z, schedule, J, O, P)
+        print(f"[CPLEX] Warm start: Cmax={upper}, bigM={bigM}")
+    size = model_size(mdl)
+    print("[CPLEX] Model size: {variables} vars ({binary} binary, {continuous} continuous), "
+          "{constraints} constraints".format(**size))
     res = solve_and_extract(mdl, S, C, Co, Cmax, X, Z)
+    res['model_size'] = size
+    res['warm_start_Cmax'] = upper
 
     machines_chosen, processing_times_ga, chromosome = _to_ga_formats(
         numJ, numO, J, O, Mset, P, res['Z1'], res['S']
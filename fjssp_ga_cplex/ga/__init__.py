@@ -1,7 +1,27 @@
 from .io import read_data
-from .gene import parse_gene
-from .schedule import get_operation_details, calculate_makespan
+from .gene import parse_gene, format_gene
+from .instance import Instance, compile_instance
+from .schedule import (
+    get_operation_details,
+    calculate_makespan,
+    calculate_makespans,
+    active_operation_details,
+    active_makespan,
+    swap_makespans,
+)
+from .fitness import FitnessCache, evaluate_population
+from .history import BestHistory
+from .checkpoint import Checkpoint
+from .critical import CriticalPath
 from .chromosome import create_chromosome, generate_population
+from .dispatching import dispatch_chromosome, check_rules, RULES
+from .flexible import (
+    FlexibleInstance,
+    compile_flexible_instance,
+    flexible_operation_details,
+    flexible_makespan,
+    flexible_genetic_algorithm,
+)
 
 from .operators import (
     select,
@@ -12,10 +32,32 @@ from .operators import (
     mutate,
 )
 
-from .ga import genetic_algorithm
-from .viz import (
-    plot_makespan_history,
-    plot_gantt_chart,
-    animate_gantt_and_makespan,
-    chromosome_gantt_chart,
-)
+from .ga import genetic_algorithm, evolve
+from .islands import island_genetic_algorithm
+from .steady_state import steady_state_genetic_algorithm
+
+# Plotting pulls in matplotlib, so these names are resolved on first use.
+_LAZY = {
+    "plot_makespan_history": "viz",
+    "plot_gantt_chart": "viz",
+    "animate_gantt_and_makespan": "viz",
+    "chromosome_gantt_chart": "viz",
+    "schedule_gantt_chart": "viz",
+    "save_animation": "viz",
+    "check_animation_writer": "viz",
+    "generate_color_map": "utils",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,151 @@
+import os
+import random
+import hashlib
+from pathlib import Path
+
+import numpy as np
+
+__all__ = ["Checkpoint", "instance_fingerprint"]
+
+CHECKPOINT_FORMAT = 1
+
+
+def instance_fingerprint(instance):
+    h = hashlib.sha256()
+    for values, dtype in ((instance.op_job, np.int64), (instance.op_machine, np.int64),
+                          (instance.op_duration, np.float64)):
+        h.update(np.asarray(values, dtype=dtype).tobytes())
+    return h.hexdigest()
+
+
+def _pack_rng(state):
+    version, internal, gauss = state
+    return {
+        "version": np.int64(version),
+        "internal": np.asarray(internal, dtype=np.uint32),
+        "gauss": np.float64(np.nan if gauss is None else gauss),
+        "has_gauss": np.bool_(gauss is not None),
+    }
+
+
+def _unpack_rng(data, prefix):
+    gauss = float(data[f"{prefix}gauss"]) if bool(data[f"{prefix}has_gauss"]) else None
+    internal = tuple(int(v) for v in data[f"{prefix}internal"])
+    return int(data[f"{prefix}version"]), internal, gauss
+
+
+def _matrix(chromosomes, width):
+    if not chromosomes:
+        return np.zeros((0, width), dtype=np.int32)
+    return np.asarray([list(ch) for ch in chromosomes], dtype=np.int32)
+
+
+class Checkpoint:
+    """Periodic, atomic snapshot of a GA run in one ``.npz`` file.
+
+    A snapshot holds the population and its makespans, the global ``random``
+    state (and the worker pool's seed stream, if any), the next generation,
+    the makespan history, the recorded ``BestHistory`` and the
+    ``StoppingRule`` progress, all as plain integer/float arrays. Restoring
+    it and continuing gives the same run, generation for generation, as if
+    it had never stopped.
+
+    ``interval`` is in generations; the file is written to a temporary name
+    and moved into place, so a preempted write leaves the previous snapshot.
+    """
+
+    def __init__(self, path, interval=10):
+        if interval < 1:
+            raise ValueError("checkpoint interval must be >= 1")
+        self.path = Path(path)
+        self.interval = interval
+
+    def due(self, generation):
+        """True after every ``interval``-th finished generation (0-based index)."""
+        return (generation + 1) % self.interval == 0
+
+    def exists(self):
+        return self.path.exists()
+
+    def save(self, instance, generation, population, scores, makespan_history, history, stop,
+             pool_rng=None):
+        n = instance.num_operations
+        recorded = history.state()
+        pending = recorded["pending"]
+        data = {
+            "format": np.int64(CHECKPOINT_FORMAT),
+            "fingerprint": np.array(instance_fingerprint(instance)),
+            "generation": np.int64(generation),
+            "population": _matrix(population, n),
+            "scores": np.asarray(scores, dtype=np.float64),
+            "makespan_history": np.asarray(makespan_history, dtype=np.float64),
+            "history_policy": np.array(recorded["policy"]),
+            "history_generations": np.asarray([g for g, _ in recorded["entries"]], dtype=np.int64),
+            "history_chromosomes": _matrix([ch for _, ch in recorded["entries"]], n),
+            "history_best": np.float64(recorded["best"]),
+            "history_pending": _matrix([] if pending is None else [pending[1]], n),
+            "history_pending_generation": np.int64(-1 if pending is None else pending[0]),
+            "stop_best_makespan": np.float64(stop.best_makespan),
+            "stop_best_chromosome": np.asarray(stop.best_chromosome or [], dtype=np.int32),
+            "stop_stagnation": np.int64(stop.stagnation),
+            "stop_completed": np.int64(stop.completed),
+            "stop_elapsed": np.float64(stop.elapsed),
+        }
+        data.update({f"rng_{k}": v for k, v in _pack_rng(random.getstate()).items()})
+        if pool_rng is not None:
+            data.update({f"pool_rng_{k}": v for k, v in _pack_rng(pool_rng.getstate()).items()})
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp.npz")
+        np.savez_compressed(tmp, **data)
+        os.replace(tmp, self.path)
+
+    def load(self, instance):
+        """The saved run state as a dict, checked against ``instance``."""
+        with np.load(self.path, allow_pickle=False) as data:
+            if int(data["format"]) != CHECKPOINT_FORMAT:
+                raise ValueError(f"Unsupported checkpoint format in {self.path}")
+            if str(data["fingerprint"]) != instance_fingerprint(instance):
+                raise ValueError(f"Checkpoint {self.path} was written for a different instance")
+            pending = data["history_pending"]
+            best_chromosome = data["stop_best_chromosome"].tolist()
+            state = {
+                "generation": int(data["generation"]),
+                "population": data["population"].tolist(),
+                "scores": data["scores"].tolist(),
+                "makespan_history": data["makespan_history"].tolist(),
+                "history_policy": str(data["history_policy"]),
+                "history_entries": list(zip(data["history_generations"].tolist(),
+                                            data["history_chromosomes"].tolist())),
+                "history_best": float(data["history_best"]),
+                "history_pending": ((int(data["history_pending_generation"]), pending[0].tolist())
+                                    if len(pending) else None),
+                "stop_best_makespan": float(data["stop_best_makespan"]),
+                "stop_best_chromosome": best_chromosome or None,
+                "stop_stagnation": int(data["stop_stagnation"]),
+                "stop_completed": int(data["stop_completed"]),
+                "stop_elapsed": float(data["stop_elapsed"]),
+                "rng_state": _unpack_rng(data, "rng_"),
+                "pool_rng_state": _unpack_rng(data, "pool_rng_") if "pool_rng_version" in data else None,
+            }
+        return state
+
+    @staticmethod
+    def restore(state, history, stop, pool_rng=None):
+        """Put ``state`` back into ``history``, ``stop`` and the RNGs (after ``stop.start()``)."""
+        history.load_state({
+            "policy": state["history_policy"],
+            "entries": state["history_entries"],
+            "best": state["history_best"],
+            "pending": state["history_pending"],
+        })
+
+        stop.best_makespan = state["stop_best_makespan"]
+        stop.best_chromosome = state["stop_best_chromosome"]
+        stop.stagnation = state["stop_stagnation"]
+        stop.completed = state["stop_completed"]
+        stop.started -= state["stop_elapsed"]
+
+        random.setstate(state["rng_state"])
+        if pool_rng is not None and state["pool_rng_state"] is not None:
+            pool_rng.setstate(state["pool_rng_state"])
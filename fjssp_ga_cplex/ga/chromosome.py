@@ -1,25 +1,54 @@
 import random
-from collections import defaultdict
 
+from .dispatching import RULES, check_rules, seed_stream
 
-def create_chromosome(machines, order):
-    machine_to_ops = defaultdict(list)
-    for op, machines_list in machines.items():
-        for job_index, machine_id in enumerate(machines_list):
-            machine_to_ops[machine_id].append(f'J{job_index + 1}O{op}')
 
+def create_chromosome(instance, order):
     chromosome = []
-    used_operations = set()
+    used_machines = set()
     for machine_id in order:
-        available_ops = [op for op in machine_to_ops[machine_id] if op not in used_operations]
+        if machine_id in used_machines:
+            continue
+        available_ops = list(instance.machine_ops.get(machine_id, ()))
         random.shuffle(available_ops)
         chromosome.extend(available_ops)
-        used_operations.update(available_ops)
+        used_machines.add(machine_id)
     return chromosome
 
 
-def generate_population(machines, order, population_size):
+def generate_population(instance, order, population_size, seed_fraction=0.0, rules=RULES,
+                        alpha=0.2, max_attempts=None):
+    """Distinct initial chromosomes, optionally part rule-seeded.
+
+    ``seed_fraction`` of the population comes from the dispatching rules
+    in ``rules`` (see ``ga.dispatching``), the rest from
+    :func:`create_chromosome`; ``rules`` must be a non-empty subset of
+    ``RULES``. Each part stops drawing after
+    ``max_attempts`` tries (default ``10 * population_size + 100``); if an
+    instance has too few distinct chromosomes the population is padded with
+    random, possibly repeated, ones instead of looping forever.
+    """
+    if not 0.0 <= seed_fraction <= 1.0:
+        raise ValueError("seed_fraction must be between 0 and 1")
+    rules = check_rules(rules)
+    if max_attempts is None:
+        max_attempts = 10 * population_size + 100
     population = set()
-    while len(population) < population_size:
-        population.add(tuple(create_chromosome(machines, order)))
-    return [list(chrom) for chrom in population]
+
+    num_seeded = round(seed_fraction * population_size)
+    if num_seeded:
+        seeds = seed_stream(instance, rules, alpha)
+        for _ in range(max_attempts):
+            if len(population) >= num_seeded:
+                break
+            population.add(tuple(next(seeds)))
+
+    for _ in range(max_attempts):
+        if len(population) >= population_size:
+            break
+        population.add(tuple(create_chromosome(instance, order)))
+
+    chromosomes = [list(chrom) for chrom in population]
+    while len(chromosomes) < population_size:
+        chromosomes.append(create_chromosome(instance, order))
+    return chromosomes
@@ -0,0 +1,233 @@
+import heapq
+
+from .schedule import get_operation_details
+
+__all__ = ["CriticalPath", "NEIGHBORHOODS"]
+
+NEIGHBORHOODS = ("n5", "n7")
+
+
+class CriticalPath:
+    """Head/tail analysis of a decoded chromosome.
+
+    Operations are ordered on their job and machine by start time, which
+    gives the disjunctive graph of the schedule. ``head[op]`` is the start
+    time, ``tail[op]`` the longest path from the end of ``op`` to the end of
+    the schedule, and ``op`` is critical when ``head + duration + tail``
+    equals the makespan. ``path`` is one critical path (operation ids in
+    time order) and ``blocks`` its maximal runs on a single machine.
+    """
+
+    def __init__(self, chromosome, instance, decoder="semi_active"):
+        self.instance = instance
+        self.chromosome = list(chromosome)
+        n = instance.num_operations
+        duration = instance.op_duration
+        details = get_operation_details(self.chromosome, instance, decoder)
+
+        head = [0.0] * n
+        for op, (_, _, start, _, _) in zip(self.chromosome, details):
+            head[op] = start
+        rank = {op: k for k, op in enumerate(self.chromosome)}
+        order = sorted(self.chromosome, key=lambda op: (head[op], rank[op]))
+        self.head = head
+        self.order = order
+
+        job_prev, job_next = [-1] * n, [-1] * n
+        machine_prev, machine_next = [-1] * n, [-1] * n
+        last_job = [-1] * instance.num_jobs
+        last_machine = [-1] * instance.num_machines
+        sequences = [[] for _ in range(instance.num_machines)]
+        for op in order:
+            j, m = instance.op_job[op], instance.op_machine[op]
+            if last_job[j] >= 0:
+                job_prev[op], job_next[last_job[j]] = last_job[j], op
+            if last_machine[m] >= 0:
+                machine_prev[op], machine_next[last_machine[m]] = last_machine[m], op
+            last_job[j] = last_machine[m] = op
+            sequences[m].append(op)
+        self.job_prev, self.job_next = job_prev, job_next
+        self.machine_prev, self.machine_next = machine_prev, machine_next
+        self.sequences = sequences
+        self.position = [0] * n
+        for seq in sequences:
+            for k, op in enumerate(seq):
+                self.position[op] = k
+
+        tail = [0.0] * n
+        for op in reversed(order):
+            q = 0.0
+            for s in (job_next[op], machine_next[op]):
+                if s >= 0 and duration[s] + tail[s] > q:
+                    q = duration[s] + tail[s]
+            tail[op] = q
+        self.tail = tail
+        self.makespan = max((head[op] + duration[op] for op in order), default=float('inf'))
+
+        self.path, self.blocks = self._trace()
+
+    def _end(self, op):
+        return self.head[op] + self.instance.op_duration[op]
+
+    def _trace(self):
+        if not self.order:
+            return [], []
+        op = max(reversed(self.order), key=self._end)
+        path, arcs = [op], []
+        while True:
+            mp, jp = self.machine_prev[op], self.job_prev[op]
+            if mp >= 0 and self._end(mp) == self.head[op]:
+                op = mp
+                arcs.append(True)
+            elif jp >= 0 and self._end(jp) == self.head[op]:
+                op = jp
+                arcs.append(False)
+            else:
+                break
+            path.append(op)
+        path.reverse()
+        arcs.reverse()
+
+        blocks = [[path[0]]]
+        for op, on_machine in zip(path[1:], arcs):
+            if on_machine:
+                blocks[-1].append(op)
+            else:
+                blocks.append([op])
+        return path, blocks
+
+    def is_critical(self, op, tolerance=1e-6):
+        length = self.head[op] + self.instance.op_duration[op] + self.tail[op]
+        return length >= self.makespan - tolerance
+
+    def _segment(self, u, v):
+        """Old and new machine order of the operations ``u`` jumps over."""
+        seq = self.sequences[self.instance.op_machine[u]]
+        i, j = self.position[u], self.position[v]
+        if i < j:
+            old = seq[i:j + 1]
+            return old, old[1:] + [u]
+        old = seq[j:i + 1]
+        return old, [u] + old[:-1]
+
+    def moves(self, neighborhood="n5"):
+        """Critical-block moves ``(u, v)`` on one machine.
+
+        A move takes ``u`` out of its machine sequence and puts it right
+        after ``v`` if ``u`` came first, right before it otherwise; for
+        adjacent operations this is a swap. ``"n5"`` swaps the first two
+        operations of every block but the first and the last two of every
+        block but the last. ``"n7"`` also moves inner operations to the
+        front and back of their block and the block's first and last
+        operations inwards. Moves that would reorder one job are skipped.
+        """
+        if neighborhood not in NEIGHBORHOODS:
+            raise ValueError(f"Unknown neighborhood: {neighborhood} (expected one of {NEIGHBORHOODS})")
+        op_job = self.instance.op_job
+        found, seen = [], set()
+        last = len(self.blocks) - 1
+        for b, block in enumerate(self.blocks):
+            if len(block) < 2:
+                continue
+            pairs = []
+            if b > 0:
+                pairs.append((block[0], block[1]))
+            if b < last:
+                pairs.append((block[-2], block[-1]))
+            if neighborhood == "n7":
+                first, inner, end = block[0], block[1:-1], block[-1]
+                pairs += [(op, first) for op in inner] + [(op, end) for op in inner]
+                pairs += [(first, op) for op in inner] + [(end, op) for op in inner]
+            for u, v in pairs:
+                if (u, v) in seen:
+                    continue
+                seen.add((u, v))
+                old, _ = self._segment(u, v)
+                if all(op_job[op] != op_job[u] for op in old if op != u):
+                    found.append((u, v))
+        return found
+
+    def estimate(self, u, v):
+        """Makespan estimate after the move ``(u, v)``.
+
+        Heads are recomputed forward and tails backward over the machine
+        segment the move reorders, holding everything else fixed, so an
+        adjacent swap costs O(1) (Taillard's estimate). The result is the
+        longest path through the segment; the decoded makespan can differ.
+        """
+        duration = self.instance.op_duration
+        tail = self.tail
+        old, segment = self._segment(u, v)
+
+        new_head = {}
+        prev = self.machine_prev[old[0]]
+        ready = self._end(prev) if prev >= 0 else 0.0
+        for op in segment:
+            jp = self.job_prev[op]
+            r = self._end(jp) if jp >= 0 else 0.0
+            if ready > r:
+                r = ready
+            new_head[op] = r
+            ready = r + duration[op]
+
+        best = 0.0
+        nxt = self.machine_next[old[-1]]
+        after = duration[nxt] + tail[nxt] if nxt >= 0 else 0.0
+        for op in reversed(segment):
+            jn = self.job_next[op]
+            q = duration[jn] + tail[jn] if jn >= 0 else 0.0
+            if after > q:
+                q = after
+            total = new_head[op] + duration[op] + q
+            if total > best:
+                best = total
+            after = duration[op] + q
+        return best
+
+    def scored_moves(self, neighborhood="n5"):
+        """``(estimate, u, v)`` for every move of ``neighborhood``."""
+        return [(self.estimate(u, v), u, v) for u, v in self.moves(neighborhood)]
+
+    def apply(self, u, v):
+        """Chromosome whose decode realises the move ``(u, v)``, or ``None``.
+
+        The new chromosome is a topological order of the job and machine
+        sequences with the move applied, keeping the current start-time
+        order wherever possible. ``None`` means the move would create a cycle.
+        """
+        m = self.instance.op_machine[u]
+        old, segment = self._segment(u, v)
+        first = self.position[old[0]]
+        seq = self.sequences[m][:]
+        seq[first:first + len(old)] = segment
+
+        succ = {op: [] for op in self.order}
+        indegree = dict.fromkeys(self.order, 0)
+        for op in self.order:
+            jn = self.job_next[op]
+            if jn >= 0:
+                succ[op].append(jn)
+                indegree[jn] += 1
+        for k, mseq in enumerate(self.sequences):
+            if k == m:
+                mseq = seq
+            for a, b in zip(mseq, mseq[1:]):
+                succ[a].append(b)
+                indegree[b] += 1
+
+        rank = {op: k for k, op in enumerate(self.order)}
+        for op, slot in zip(segment, sorted(rank[x] for x in old)):
+            rank[op] = slot
+        heap = [(rank[op], op) for op in self.order if indegree[op] == 0]
+        heapq.heapify(heap)
+        chromosome = []
+        while heap:
+            _, op = heapq.heappop(heap)
+            chromosome.append(op)
+            for s in succ[op]:
+                indegree[s] -= 1
+                if indegree[s] == 0:
+                    heapq.heappush(heap, (rank[s], s))
+        if len(chromosome) != len(self.order):
+            return None
+        return chromosome
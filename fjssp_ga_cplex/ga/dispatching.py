@@ -0,0 +1,101 @@
+import random
+
+__all__ = ["RULES", "check_rules", "dispatch_chromosome", "seed_stream"]
+
+RULES = ("spt", "lpt", "mwkr", "mor")
+
+
+def check_rules(rules):
+    """``rules`` as a tuple; a ValueError if it is empty or has an unknown name."""
+    rules = tuple(rules)
+    if not rules:
+        raise ValueError(f"No dispatching rules given (expected some of {RULES})")
+    unknown = [rule for rule in rules if rule not in RULES]
+    if unknown:
+        raise ValueError(f"Unknown dispatching rule(s): {unknown} (expected some of {RULES})")
+    return rules
+
+
+def _job_ops(instance):
+    job_ops = [[] for _ in range(instance.num_jobs)]
+    for op in range(instance.num_operations):
+        job_ops[instance.op_job[op]].append(op)
+    for ops in job_ops:
+        ops.sort(key=instance.op_number.__getitem__)
+    return job_ops
+
+
+def dispatch_chromosome(instance, rule="spt", alpha=0.0):
+    """Chromosome built by non-delay list scheduling with a dispatching rule.
+
+    At each step the next operation of every job is a candidate; only those
+    that can start earliest are kept, and ``rule`` picks among them:
+
+    * ``"spt"`` / ``"lpt"`` - shortest / longest processing time
+    * ``"mwkr"`` - most work remaining in the job
+    * ``"mor"`` - most operations remaining in the job
+
+    With ``alpha > 0`` the choice is randomized-greedy: any candidate whose
+    priority is within ``alpha`` of the best (as a fraction of the range)
+    may be drawn. ``alpha=0`` is deterministic, ties going to the lower job.
+    The dispatch order is returned, so the semi-active decode reproduces the
+    constructed schedule.
+    """
+    if rule not in RULES:
+        raise ValueError(f"Unknown dispatching rule: {rule} (expected one of {RULES})")
+    duration, op_machine = instance.op_duration, instance.op_machine
+    job_ops = _job_ops(instance)
+    work_left = [sum(duration[op] for op in ops) for ops in job_ops]
+    next_pos = [0] * instance.num_jobs
+    job_ready = [0.0] * instance.num_jobs
+    machine_ready = [0.0] * instance.num_machines
+    active = [j for j in range(instance.num_jobs) if job_ops[j]]
+
+    def priority(j):
+        op = job_ops[j][next_pos[j]]
+        if rule == "spt":
+            return -duration[op]
+        if rule == "lpt":
+            return duration[op]
+        if rule == "mwkr":
+            return work_left[j]
+        return len(job_ops[j]) - next_pos[j]
+
+    chromosome = []
+    while active:
+        starts = {}
+        for j in active:
+            op = job_ops[j][next_pos[j]]
+            starts[j] = max(job_ready[j], machine_ready[op_machine[op]])
+        earliest = min(starts.values())
+        candidates = [j for j in active if starts[j] == earliest]
+
+        scored = [(priority(j), j) for j in candidates]
+        best = max(p for p, _ in scored)
+        if alpha > 0 and len(scored) > 1:
+            worst = min(p for p, _ in scored)
+            threshold = best - alpha * (best - worst)
+            j = random.choice([j for p, j in scored if p >= threshold])
+        else:
+            j = min(j for p, j in scored if p == best)
+
+        op = job_ops[j][next_pos[j]]
+        end = earliest + duration[op]
+        job_ready[j] = machine_ready[op_machine[op]] = end
+        work_left[j] -= duration[op]
+        next_pos[j] += 1
+        if next_pos[j] == len(job_ops[j]):
+            active.remove(j)
+        chromosome.append(op)
+    return chromosome
+
+
+def seed_stream(instance, rules=RULES, alpha=0.2):
+    """Endless rule-built chromosomes: each rule once greedily, then
+    randomized-greedy variants cycling through ``rules``."""
+    rules = check_rules(rules)
+    for rule in rules:
+        yield dispatch_chromosome(instance, rule)
+    while True:
+        for rule in rules:
+            yield dispatch_chromosome(instance, rule, alpha)
@@ -0,0 +1,134 @@
+from collections import OrderedDict
+
+from .schedule import calculate_makespan, calculate_makespans, makespan_function
+
+__all__ = ["FitnessCache", "evaluate_population"]
+
+
+class FitnessCache:
+    """Memoized makespan evaluation keyed by chromosome content.
+
+    One cache is shared by every operator of a GA run, so a chromosome that
+    is scored by ``select``, again by ``pair_crossover``/``individual_mutate``
+    and again for the generation's best is only decoded once.
+
+    ``capacity`` bounds the number of stored entries (``None`` = unbounded,
+    ``0`` = caching disabled). ``policy`` is ``"lru"`` (a hit refreshes the
+    entry) or ``"fifo"`` (entries are evicted in insertion order).
+    :meth:`evaluate_population` sends the misses of a population through
+    :func:`calculate_makespans` once there are at least ``batch_min`` of them.
+    ``decoder`` (``"semi_active"`` or ``"active"``) picks the default
+    ``evaluate``; operators read it to score moves with the same decoder.
+    """
+
+    def __init__(self, instance, capacity=100_000, policy="lru", evaluate=None,
+                 batch_min=64, decoder="semi_active"):
+        if policy not in ("lru", "fifo"):
+            raise ValueError(f"Unknown eviction policy: {policy}")
+        if capacity is not None and capacity < 0:
+            raise ValueError("capacity must be >= 0 or None")
+        if evaluate is None:
+            evaluate = makespan_function(decoder)
+        self.instance = instance
+        self.decoder = decoder
+        self.capacity = capacity
+        self.policy = policy
+        self.evaluate = evaluate
+        self.batch_min = batch_min
+        self._store = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __call__(self, chromosome):
+        key = tuple(chromosome)
+        store = self._store
+        value = store.get(key)
+        if value is not None:
+            self.hits += 1
+            if self.policy == "lru":
+                store.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = self.evaluate(chromosome, self.instance)
+        self._put(key, value)
+        return value
+
+    def evaluate_population(self, population):
+        store = self._store
+        values = [None] * len(population)
+        pending = {}
+        for i, chromosome in enumerate(population):
+            key = tuple(chromosome)
+            value = store.get(key)
+            if value is not None:
+                self.hits += 1
+                if self.policy == "lru":
+                    store.move_to_end(key)
+                values[i] = value
+            elif key in pending:
+                self.hits += 1
+                pending[key].append(i)
+            else:
+                self.misses += 1
+                pending[key] = [i]
+
+        if pending:
+            keys = list(pending)
+            if self.evaluate is calculate_makespan and len(keys) >= self.batch_min:
+                scores = calculate_makespans(keys, self.instance).tolist()
+            else:
+                scores = [self.evaluate(list(key), self.instance) for key in keys]
+            for key, value in zip(keys, scores):
+                for i in pending[key]:
+                    values[i] = value
+                self._put(key, value)
+        return values
+
+    def add(self, chromosome, value):
+        """Record a makespan computed elsewhere (e.g. in a worker process)."""
+        self._put(tuple(chromosome), value)
+
+    def _put(self, key, value):
+        if self.capacity == 0:
+            return
+        store = self._store
+        store[key] = value
+        if self.capacity is not None and len(store) > self.capacity:
+            store.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self._store)
+
+    def clear(self):
+        self._store.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._store),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def evaluate_population(population, instance, fitness=None):
+    """Makespans of ``population`` as a list, batched where possible.
+
+    Without ``fitness`` the population goes straight through
+    :func:`calculate_makespans`; a :class:`FitnessCache` only decodes its
+    misses; any other callable is applied per chromosome.
+    """
+    if not population:
+        return []
+    if fitness is None:
+        return calculate_makespans(population, instance).tolist()
+    batch = getattr(fitness, "evaluate_population", None)
+    if batch is not None:
+        return batch(population)
+    return [fitness(ch) for ch in population]
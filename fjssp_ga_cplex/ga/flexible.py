@@ -0,0 +1,338 @@
+import random
+
+import numpy as np
+
+from .gene import format_gene
+from .schedule import _active_gaps, _check_decoder, _insert_active
+from .fitness import FitnessCache, evaluate_population
+from .history import BestHistory
+from .stopping import StoppingRule
+from .operators import select, divide_into_pairs
+
+__all__ = [
+    "FlexibleInstance",
+    "compile_flexible_instance",
+    "flexible_operation_details",
+    "flexible_makespan",
+    "flexible_makespan_function",
+    "random_flexible_chromosome",
+    "flexible_crossover",
+    "flexible_mutate",
+    "flexible_genetic_algorithm",
+]
+
+
+class FlexibleInstance:
+    """Integer-indexed flexible job shop: each operation may run on any of
+    its eligible machines.
+
+    Operation ids are job-major, as in :class:`~ga.instance.Instance`.
+    ``times`` is a dense ``(num_jobs, num_op_numbers, num_machines)`` array
+    of processing times, ``inf`` where the machine is not eligible;
+    ``op_times[op]`` is the same row as a list for the decoder.
+
+    A chromosome is two vectors kept in one flat list, so it hashes and
+    caches like a fixed-routing one: ``chromosome[:n]`` assigns a machine
+    index to every operation id and ``chromosome[n:]`` is the operation
+    sequence in job-repetition form (job ``j`` appears once per operation;
+    its k-th occurrence is its k-th operation), so every permutation keeps
+    job precedence.
+    """
+
+    def __init__(self, eligible, processing_times):
+        self.op_numbers = sorted(processing_times.keys())
+        o_pos = {o: k for k, o in enumerate(self.op_numbers)}
+        self.num_jobs = max((j for j, _ in eligible), default=0)
+        self.machine_ids = sorted({m for ms in eligible.values() for m in ms})
+        machine_index = {m: k for k, m in enumerate(self.machine_ids)}
+        inf = float('inf')
+
+        self.times = np.full((self.num_jobs, len(self.op_numbers), len(self.machine_ids)), inf)
+        self.op_job = []
+        self.op_number = []
+        self.op_eligible = []
+        self.op_times = []
+        self.genes = []
+        self.index = {}
+        self.job_ops = [[] for _ in range(self.num_jobs)]
+        for j in range(1, self.num_jobs + 1):
+            for o in self.op_numbers:
+                ms = eligible.get((j, o))
+                if not ms:
+                    continue
+                op = len(self.genes)
+                p = float(processing_times[o][j - 1])
+                ks = [machine_index[m] for m in ms]
+                self.times[j - 1, o_pos[o], ks] = p
+                self.index[(j, o)] = op
+                self.op_job.append(j - 1)
+                self.op_number.append(o)
+                self.op_eligible.append(ks)
+                self.op_times.append(self.times[j - 1, o_pos[o]].tolist())
+                self.genes.append(format_gene(j, o))
+                self.job_ops[j - 1].append(op)
+
+        # Job-repetition sequence in job order; chromosomes shuffle it.
+        self.job_sequence = [j for j, ops in enumerate(self.job_ops) for _ in ops]
+
+    @property
+    def num_operations(self):
+        return len(self.genes)
+
+    @property
+    def num_machines(self):
+        return len(self.machine_ids)
+
+    def split(self, chromosome):
+        """``(assignment, sequence)`` views of a flat chromosome."""
+        n = self.num_operations
+        return chromosome[:n], chromosome[n:]
+
+    def lower_bound(self):
+        """Largest job length or average machine load, with every operation
+        on its fastest eligible machine."""
+        fastest = [min(row) for row in self.op_times]
+        job_load = [0.0] * self.num_jobs
+        for op, p in enumerate(fastest):
+            job_load[self.op_job[op]] += p
+        average_load = sum(fastest) / self.num_machines if self.num_machines else 0.0
+        return max(job_load + [average_load], default=0.0)
+
+    def decode(self, chromosome):
+        """``(gene, machine_id)`` pairs in sequence order, for printing."""
+        assignment, sequence = self.split(chromosome)
+        nxt = [0] * self.num_jobs
+        decoded = []
+        for j in sequence:
+            op = self.job_ops[j][nxt[j]]
+            nxt[j] += 1
+            decoded.append((self.genes[op], self.machine_ids[assignment[op]]))
+        return decoded
+
+
+def compile_flexible_instance(eligible, processing_times):
+    return FlexibleInstance(eligible, processing_times)
+
+
+def flexible_operation_details(chromosome, instance, decoder="semi_active"):
+    """Decoded schedule in ``get_operation_details`` form."""
+    _check_decoder(decoder)
+    assignment, sequence = instance.split(chromosome)
+    job_ops, op_times = instance.job_ops, instance.op_times
+    job_times = [0.0] * instance.num_jobs
+    machine_times = [0.0] * instance.num_machines
+    gap_starts, gap_ends = _active_gaps(instance)
+    nxt = [0] * instance.num_jobs
+    operation_details = []
+    for j in sequence:
+        op = job_ops[j][nxt[j]]
+        nxt[j] += 1
+        m = assignment[op]
+        duration = op_times[op][m]
+        if decoder == "active":
+            start_time = _insert_active(gap_starts[m], gap_ends[m], job_times[j], duration)
+        else:
+            start_time = max(job_times[j], machine_times[m])
+        end_time = start_time + duration
+        job_times[j] = end_time
+        if end_time > machine_times[m]:
+            machine_times[m] = end_time
+        operation_details.append(
+            (instance.genes[op], instance.machine_ids[m], start_time, end_time, duration)
+        )
+    return operation_details
+
+
+def flexible_makespan(chromosome, instance):
+    """Semi-active makespan of a flat two-vector chromosome."""
+    if not chromosome:
+        return float('inf')
+    n = instance.num_operations
+    job_ops, op_times = instance.job_ops, instance.op_times
+    job_times = [0.0] * instance.num_jobs
+    machine_times = [0.0] * instance.num_machines
+    nxt = [0] * instance.num_jobs
+    makespan = 0.0
+    for j in chromosome[n:]:
+        op = job_ops[j][nxt[j]]
+        nxt[j] += 1
+        m = chromosome[op]
+        start_time = job_times[j]
+        if machine_times[m] > start_time:
+            start_time = machine_times[m]
+        end_time = start_time + op_times[op][m]
+        job_times[j] = end_time
+        machine_times[m] = end_time
+        if end_time > makespan:
+            makespan = end_time
+    return makespan
+
+
+def _flexible_active_makespan(chromosome, instance):
+    if not chromosome:
+        return float('inf')
+    return max(end for _, _, _, end, _ in flexible_operation_details(chromosome, instance, "active"))
+
+
+def flexible_makespan_function(decoder="semi_active"):
+    """The single-chromosome evaluator for ``decoder``."""
+    _check_decoder(decoder)
+    return flexible_makespan if decoder == "semi_active" else _flexible_active_makespan
+
+
+def random_flexible_chromosome(instance, assignment="random"):
+    """Random sequence with a ``"random"`` or ``"least_loaded"`` assignment.
+
+    ``"least_loaded"`` visits the operations in random order and puts each
+    on the eligible machine whose load plus processing time is smallest.
+    """
+    if assignment == "random":
+        machines = [random.choice(ks) for ks in instance.op_eligible]
+    elif assignment == "least_loaded":
+        load = [0.0] * instance.num_machines
+        machines = [0] * instance.num_operations
+        ops = list(range(instance.num_operations))
+        random.shuffle(ops)
+        for op in ops:
+            row = instance.op_times[op]
+            m = min(instance.op_eligible[op], key=lambda k: load[k] + row[k])
+            machines[op] = m
+            load[m] += row[m]
+    else:
+        raise ValueError(f"Unknown assignment rule: {assignment}")
+    sequence = instance.job_sequence[:]
+    random.shuffle(sequence)
+    return machines + sequence
+
+
+def flexible_crossover(p1, p2, instance):
+    """Uniform crossover on the assignments and POX on the sequences.
+
+    POX keeps the positions of a random subset of jobs from one parent and
+    fills the remaining slots with the other jobs in the other parent's
+    order, so both children are valid job-repetition sequences.
+    """
+    n = instance.num_operations
+    a1, s1 = p1[:n], p1[n:]
+    a2, s2 = p2[:n], p2[n:]
+    mask = [random.random() < 0.5 for _ in range(n)]
+    c1_assign = [x if keep else y for keep, x, y in zip(mask, a1, a2)]
+    c2_assign = [y if keep else x for keep, x, y in zip(mask, a1, a2)]
+
+    jobs = list(range(instance.num_jobs))
+    kept = set(random.sample(jobs, random.randint(1, max(1, len(jobs) - 1)))) if jobs else set()
+
+    def pox(a, b):
+        fill = iter([j for j in b if j not in kept])
+        return [j if j in kept else next(fill) for j in a]
+
+    return c1_assign + pox(s1, s2), c2_assign + pox(s2, s1)
+
+
+def _neighbour(chromosome, instance):
+    """Reassign one flexible operation or swap two sequence positions of different jobs."""
+    n = instance.num_operations
+    child = chromosome[:]
+    flexible_ops = [op for op, ks in enumerate(instance.op_eligible) if len(ks) > 1]
+    if flexible_ops and random.random() < 0.5:
+        op = random.choice(flexible_ops)
+        child[op] = random.choice([k for k in instance.op_eligible[op] if k != child[op]])
+        return child
+    if instance.num_jobs < 2 or n < 2:
+        return child
+    while True:
+        i, j = random.sample(range(n, 2 * n), 2)
+        if child[i] != child[j]:
+            child[i], child[j] = child[j], child[i]
+            return child
+
+
+def flexible_mutate(chromosome, instance, fitness, tries=1):
+    """Best of ``tries`` reassignment/swap neighbours; kept only if it is better."""
+    best, best_value = chromosome[:], fitness(chromosome)
+    for _ in range(max(1, tries)):
+        child = _neighbour(chromosome, instance)
+        value = fitness(child)
+        if value < best_value:
+            best, best_value = child, value
+    return best
+
+
+def _best_two(candidates, fitness):
+    scored = sorted(((fitness(ch), tuple(ch)) for ch in candidates), key=lambda x: x[0])
+    best = [list(scored[0][1])]
+    for _, chrom in scored[1:]:
+        if chrom != tuple(best[0]):
+            best.append(list(chrom))
+            break
+    if len(best) == 1:
+        best.append(list(best[0]))
+    return best
+
+
+def _initial_population(instance, population_size, least_loaded_share, max_attempts=None):
+    if max_attempts is None:
+        max_attempts = 10 * population_size + 100
+    population = set()
+    num_loaded = round(least_loaded_share * population_size)
+    for _ in range(max_attempts):
+        if len(population) >= population_size:
+            break
+        rule = "least_loaded" if len(population) < num_loaded else "random"
+        population.add(tuple(random_flexible_chromosome(instance, rule)))
+    chromosomes = [list(ch) for ch in population]
+    while len(chromosomes) < population_size:
+        chromosomes.append(random_flexible_chromosome(instance))
+    return chromosomes
+
+
+def flexible_genetic_algorithm(instance, population_size, generations, mutation_rate, fitness=None,
+                               history=None, stop=None, decoder="semi_active", mutation_tries=1,
+                               least_loaded_share=0.5):
+    """Generational GA over two-vector chromosomes; returns the same tuple as
+    ``genetic_algorithm``.
+
+    The loop mirrors ``evolve``: the best ``mutation_rate`` share is mutated,
+    the rest is paired for :func:`flexible_crossover` keeping the best two of
+    parents and children. ``least_loaded_share`` of the initial population
+    starts from least-loaded assignments, the rest from random ones.
+    """
+    if fitness is None:
+        fitness = FitnessCache(instance, evaluate=flexible_makespan_function(decoder), decoder=decoder)
+    if history is None or isinstance(history, str):
+        history = BestHistory(instance, policy=history or "all", decoder=decoder,
+                              details=flexible_operation_details)
+    if stop is None:
+        stop = StoppingRule(generations=generations)
+    elif stop.generations is None:
+        stop.generations = generations
+    if not stop.bounded():
+        raise ValueError("GA needs generations, time_limit or max_stagnation "
+                         "(or a callback with callback_bounds=True)")
+    stop.start()
+    population = _initial_population(instance, population_size, least_loaded_share)
+
+    makespan_history = []
+    generation = 0
+    while not stop.exhausted():
+        num_mutated = int(mutation_rate * len(population))
+        mutation_population, crossover_population = select(population, instance, num_mutated, fitness)
+        pairs, one = divide_into_pairs(crossover_population)
+        if one is not None:
+            mutation_population.append(one)
+        population = []
+        for p1, p2 in pairs:
+            population.extend(_best_two([p1, p2, *flexible_crossover(p1, p2, instance)], fitness))
+        population.extend(flexible_mutate(ch, instance, fitness, mutation_tries)
+                          for ch in mutation_population)
+
+        scores = evaluate_population(population, instance, fitness)
+        best_idx = min(range(len(population)), key=scores.__getitem__)
+        makespan_history.append(scores[best_idx])
+        history.record(generation, population[best_idx], scores[best_idx])
+        stop.update(generation, population[best_idx], scores[best_idx])
+        generation += 1
+
+    scores = evaluate_population(population, instance, fitness)
+    best_idx = min(range(len(population)), key=scores.__getitem__)
+    return population[best_idx], scores[best_idx], makespan_history, history.finish()
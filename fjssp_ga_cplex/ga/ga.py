@@ -1,31 +1,130 @@
-from .schedule import calculate_makespan, get_operation_details
+import random
+from contextlib import nullcontext
+
+from .instance import compile_instance
+from .fitness import FitnessCache, evaluate_population
+from .history import make_history
+from .stopping import StoppingRule
 from .chromosome import generate_population
+from .dispatching import RULES
 from .operators import select, divide_into_pairs, pair_crossover, mutate
 
 
-def genetic_algorithm(machines, processing_times, order, population_size, generations, mutation_rate):
-    population = generate_population(machines, order, population_size)
-    makespan_history = []
-    operation_details_history = []
-    for _ in range(generations):
-        num_mutated = int(mutation_rate * len(population))
-        mutation_population, crossover_population = select(population, machines, processing_times, num_mutated)
-        pairs, one = divide_into_pairs(crossover_population)
-        if one is not None:
-            mutation_population.append(one)
+def genetic_algorithm(machines, processing_times, order, population_size, generations, mutation_rate,
+                      instance=None, fitness=None, workers=None, mutation_tries=1,
+                      crossover="one_point", history=None, stop=None, decoder="semi_active",
+                      neighborhood=None, seed_fraction=0.0, seed_rules=RULES, checkpoint=None,
+                      resume=False, cache_size=100_000):
+    """Generational GA; returns ``(best, makespan, makespan_history, history)``.
+
+    ``generations`` may be ``None`` when ``stop`` (a :class:`StoppingRule`)
+    bounds the run by time, target, stagnation or lower bound instead.
+    ``decoder="active"`` scores chromosomes with the gap-filling decoder.
+    ``neighborhood`` (``"n5"``/``"n7"``) makes mutation move operations at critical blocks.
+    ``seed_fraction`` of the initial population is built with ``seed_rules``.
+
+    ``checkpoint`` (a :class:`~ga.checkpoint.Checkpoint`) is written every
+    ``checkpoint.interval`` generations; with ``resume=True`` and an existing
+    file the run continues from it exactly where it left off.
+
+    ``workers`` runs crossover, mutation and scoring in a :class:`~ga.parallel.WorkerPool`
+    whose per-worker caches hold ``cache_size`` makespans.
+    """
+    if instance is None:
+        instance = compile_instance(machines, processing_times)
+    if fitness is None:
+        fitness = FitnessCache(instance, decoder=decoder)
+    _check_fitness_decoder(fitness, decoder)
+    history = make_history(instance, history, decoder)
+    if stop is None:
+        stop = StoppingRule(generations=generations)
+    elif stop.generations is None:
+        stop.generations = generations
+    if not stop.bounded():
+        raise ValueError("GA needs generations, time_limit or max_stagnation "
+                         "(or a callback with callback_bounds=True)")
+    stop.start()
+    state = None
+    if resume and checkpoint is not None and checkpoint.exists():
+        state = checkpoint.load(instance)
+        population = state["population"]
+        _record(fitness, zip(population, state["scores"]))
+    else:
+        population = generate_population(instance, order, population_size, seed_fraction, seed_rules)
+
+    pool_context = nullcontext()
+    if workers is not None and workers >= 1:
+        # Any explicit worker count (1 included) uses the pool's per-task seeds,
+        # so results depend on the seed only, not on the count.
+        from .parallel import WorkerPool
+        pool_context = WorkerPool(instance, workers, seed=random.getrandbits(64),
+                                  cache_size=cache_size, decoder=decoder)
+    # Leaving the block on an error (Ctrl-C included) terminates the workers.
+    with pool_context as pool:
+        makespan_history = []
+        generation = 0
+        if state is not None:
+            checkpoint.restore(state, history, stop, pool.rng if pool is not None else None)
+            makespan_history = state["makespan_history"]
+            generation = state["generation"]
+        elif pool is not None:
+            _record(fitness, zip(population, pool.makespans(population)))
+        while not stop.exhausted():
+            population = evolve(population, instance, mutation_rate, fitness, pool,
+                                mutation_tries, crossover, neighborhood)
+
+            scores = evaluate_population(population, instance, fitness)
+            best_idx = min(range(len(population)), key=scores.__getitem__)
+            makespan_history.append(scores[best_idx])
+            history.record(generation, population[best_idx], scores[best_idx])
+            stop.update(generation, population[best_idx], scores[best_idx])
+            if checkpoint is not None and checkpoint.due(generation):
+                checkpoint.save(instance, generation + 1, population, scores, makespan_history,
+                                history, stop, pool.rng if pool is not None else None)
+            generation += 1
 
+    scores = evaluate_population(population, instance, fitness)
+    best_idx = min(range(len(population)), key=scores.__getitem__)
+    best_chromosome = population[best_idx]
+    best_makespan = scores[best_idx]
+    return best_chromosome, best_makespan, makespan_history, history.finish()
+
+
+def evolve(population, instance, mutation_rate, fitness, pool=None, mutation_tries=1,
+           crossover="one_point", neighborhood=None):
+    """One generation: select, pair crossover and mutation."""
+    num_mutated = int(mutation_rate * len(population))
+    mutation_population, crossover_population = select(population, instance, num_mutated, fitness)
+    pairs, one = divide_into_pairs(crossover_population)
+    if one is not None:
+        mutation_population.append(one)
+
+    if pool is None:
         crossed_population = []
         for pair in pairs:
-            children = pair_crossover(pair, machines, processing_times)
+            children = pair_crossover(pair, instance, fitness, crossover)
             crossed_population.extend(children)
+        mutated_population = mutate(mutation_population, instance, fitness, mutation_tries,
+                                    neighborhood)
+    else:
+        crossed_population = _record(fitness, pool.crossover(pairs, crossover))
+        mutated_population = _record(fitness, pool.mutate(mutation_population, mutation_tries,
+                                                          neighborhood))
+    return crossed_population + mutated_population
+
+
+def _check_fitness_decoder(fitness, decoder):
+    found = getattr(fitness, "decoder", decoder)
+    if found != decoder:
+        raise ValueError(f"fitness uses the {found!r} decoder, expected {decoder!r}")
 
-        mutated_population = mutate(mutation_population, machines, processing_times)
-        population = crossed_population + mutated_population
 
-        best_child = min(population, key=lambda chrom: calculate_makespan(chrom, machines, processing_times))
-        makespan_history.append(calculate_makespan(best_child, machines, processing_times))
-        operation_details_history.append(get_operation_details(best_child, machines, processing_times))
-    
-    best_chromosome = min(population, key=lambda chrom: calculate_makespan(chrom, machines, processing_times))
-    best_makespan = calculate_makespan(best_chromosome, machines, processing_times)
-    return best_chromosome, best_makespan, makespan_history, operation_details_history
+def _record(fitness, scored):
+    """Feed worker-computed makespans into the shared cache; return the chromosomes."""
+    add = getattr(fitness, "add", None)
+    chromosomes = []
+    for chromosome, value in scored:
+        if add is not None:
+            add(chromosome, value)
+        chromosomes.append(chromosome)
+    return chromosomes
@@ -9,3 +9,6 @@ def parse_gene(g):
     j = int(m.group(1))
     o = int(m.group(2))
     return j, o
+
+def format_gene(j, o):
+    return f"J{j}O{o}"
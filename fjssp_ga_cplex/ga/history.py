@@ -0,0 +1,111 @@
+from array import array
+from collections import deque
+
+from .schedule import get_operation_details
+
+__all__ = ["BestHistory", "make_history"]
+
+POLICIES = ("none", "all", "every", "improvement", "last")
+
+
+class BestHistory:
+    """Compact record of the best chromosome per generation.
+
+    Only operation-id snapshots (``array('i')``) are stored; indexing the
+    history decodes the snapshot into ``get_operation_details`` form on
+    demand, so it can stand in for the old list of details.
+
+    Policies: ``"none"`` records nothing, ``"all"`` every generation,
+    ``"every"`` every ``interval``-th generation (plus the last one),
+    ``"improvement"`` only when the best makespan improves and ``"last"``
+    keeps a ring buffer of the latest ``capacity`` generations. Snapshots
+    are decoded with ``decoder`` by ``details`` (default
+    ``get_operation_details``; the flexible GA passes its own decoder).
+    """
+
+    def __init__(self, instance, policy="all", interval=1, capacity=None, decoder="semi_active",
+                 details=None):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown history policy: {policy} (expected one of {POLICIES})")
+        if interval < 1:
+            raise ValueError("interval must be >= 1")
+        if policy == "last" and (capacity is None or capacity < 1):
+            raise ValueError("policy 'last' needs capacity >= 1")
+        self.instance = instance
+        self.policy = policy
+        self.interval = interval
+        self.capacity = capacity
+        self.decoder = decoder
+        self.details = details or get_operation_details
+        self._entries = deque(maxlen=capacity) if policy == "last" else []
+        self._best = float('inf')
+        self._pending = None
+
+    def record(self, generation, chromosome, makespan):
+        policy = self.policy
+        if policy == "none":
+            return
+        if policy == "improvement":
+            if makespan >= self._best:
+                return
+            self._best = makespan
+        elif policy == "every":
+            if generation % self.interval:
+                # Remember the latest generation so finish() can add it.
+                self._pending = (generation, chromosome)
+                return
+        self._pending = None
+        self._entries.append((generation, array('i', chromosome)))
+
+    def finish(self):
+        """Flush the final generation for the ``"every"`` policy."""
+        if self._pending is not None:
+            generation, chromosome = self._pending
+            self._entries.append((generation, array('i', chromosome)))
+            self._pending = None
+        return self
+
+    def state(self):
+        """Plain snapshot of the recorded entries, for checkpoints."""
+        return {
+            "policy": self.policy,
+            "entries": [(g, list(ch)) for g, ch in self._entries],
+            "best": self._best,
+            "pending": None if self._pending is None else (self._pending[0], list(self._pending[1])),
+        }
+
+    def load_state(self, state):
+        """Replace the recorded entries with a :meth:`state` snapshot."""
+        if state["policy"] != self.policy:
+            raise ValueError(f"History state has policy {state['policy']!r}, "
+                             f"this history uses {self.policy!r}")
+        self._entries.clear()
+        self._entries.extend((g, array('i', ch)) for g, ch in state["entries"])
+        self._best = state["best"]
+        self._pending = state["pending"]
+
+    @property
+    def generations(self):
+        return [g for g, _ in self._entries]
+
+    def chromosome(self, i):
+        return list(self._entries[i][1])
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, i):
+        return self.details(self._entries[i][1], self.instance, self.decoder)
+
+    def __iter__(self):
+        for i in range(len(self._entries)):
+            yield self[i]
+
+
+def make_history(instance, history, decoder="semi_active"):
+    """Accept a policy name or a ready ``BestHistory``."""
+    if history is None:
+        return BestHistory(instance, decoder=decoder)
+    if isinstance(history, str):
+        return BestHistory(instance, policy=history, decoder=decoder)
+    return history
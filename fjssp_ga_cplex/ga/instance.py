@@ -0,0 +1,88 @@
+import numpy as np
+
+from .gene import parse_gene, format_gene
+
+__all__ = ["Instance", "compile_instance"]
+
+
+class Instance:
+    """Integer-indexed view of a GA instance, built once per run.
+
+    Every operation ``(j, o)`` gets a dense id ``0..num_operations-1``
+    (job-major order). Chromosomes are lists of these ids; the per-operation
+    arrays below replace the ``J{j}O{o}`` parsing and nested dict lookups
+    in the decoder. String genes are only produced at the edges via
+    :meth:`decode`.
+    """
+
+    def __init__(self, machines, processing_times):
+        op_numbers = sorted(machines.keys())
+        self.num_jobs = max((len(machines[o]) for o in op_numbers), default=0)
+        self.machine_ids = sorted({
+            m for o in op_numbers for m in machines[o] if m is not None
+        })
+        machine_index = {m: k for k, m in enumerate(self.machine_ids)}
+
+        self.op_job = []
+        self.op_number = []
+        self.op_machine = []
+        self.op_duration = []
+        self.genes = []
+        self.index = {}
+        for j in range(1, self.num_jobs + 1):
+            for o in op_numbers:
+                row = machines[o]
+                if j - 1 >= len(row) or row[j - 1] is None:
+                    continue
+                self.index[(j, o)] = len(self.genes)
+                self.op_job.append(j - 1)
+                self.op_number.append(o)
+                self.op_machine.append(machine_index[row[j - 1]])
+                self.op_duration.append(float(processing_times[o][j - 1]))
+                self.genes.append(format_gene(j, o))
+
+        # Same arrays as NumPy vectors for the batched population evaluator.
+        self.op_job_array = np.asarray(self.op_job, dtype=np.intp)
+        self.op_machine_array = np.asarray(self.op_machine, dtype=np.intp)
+        self.op_duration_array = np.asarray(self.op_duration, dtype=np.float64)
+
+        # Operations grouped per machine in the (o, j) order that
+        # ``create_chromosome`` has always shuffled them in.
+        self.machine_ops = {m: [] for m in self.machine_ids}
+        for o in op_numbers:
+            for j in range(1, len(machines[o]) + 1):
+                op = self.index.get((j, o))
+                if op is not None:
+                    self.machine_ops[machines[o][j - 1]].append(op)
+
+    @property
+    def num_operations(self):
+        return len(self.genes)
+
+    @property
+    def num_machines(self):
+        return len(self.machine_ids)
+
+    def lower_bound(self):
+        """Trivial makespan bound: the largest job length or machine load."""
+        job_load = [0.0] * self.num_jobs
+        machine_load = [0.0] * self.num_machines
+        for op, d in enumerate(self.op_duration):
+            job_load[self.op_job[op]] += d
+            machine_load[self.op_machine[op]] += d
+        return max(job_load + machine_load, default=0.0)
+
+    def machine_of(self, op):
+        return self.machine_ids[self.op_machine[op]]
+
+    def encode(self, chromosome):
+        """Map ``J{j}O{o}`` genes to operation ids; ids pass through unchanged."""
+        return [g if isinstance(g, int) else self.index[parse_gene(g)] for g in chromosome]
+
+    def decode(self, chromosome):
+        """Map operation ids back to ``J{j}O{o}`` genes."""
+        return [self.genes[op] for op in chromosome]
+
+
+def compile_instance(machines, processing_times):
+    return Instance(machines, processing_times)
@@ -1,8 +1,49 @@
+import os
 import re
-import pandas as pd
+import zlib
+import hashlib
+import zipfile
+from pathlib import Path
 from collections import defaultdict
+from typing import Optional, Union
+
+import numpy as np
+
+CACHE_FORMAT = 2
+CACHE_ENV = "FJSSP_GA_CACHE_DIR"
+
+
+def build_order(machines_dict):
+    machine_count = defaultdict(int)
+    for op in sorted(machines_dict.keys()):
+        for m in machines_dict[op]:
+            machine_count[m] += 1
+    order = []
+    for m, count in machine_count.items():
+        order.extend([m] * count)
+    return order
+
+
+def _parse_machine_id(c):
+    try:
+        return int(c)
+    except Exception:
+        digits = re.findall(r"\d+", str(c))
+        if not digits:
+            raise ValueError(f"Cannot parse machine id from column '{c}'")
+        return int(digits[-1])
+
+
+def _parse_excel(file_path: str):
+    """Parse the ``P``/``M`` sheets into dense arrays (op-major, job columns).
+
+    Returns ``(op_ids, machine_table, time_table, machine_ids, eligibility)``
+    where ``machine_table`` holds the first eligible machine (``-1`` for
+    (j, o) pairs absent from ``M``) and ``eligibility[o, j, k]`` flags every
+    machine ``machine_ids[k]`` marked with a 1.
+    """
+    import pandas as pd
 
-def read_parameters_from_excel(file_path: str):
     xls = pd.ExcelFile(file_path)
     df_p = pd.read_excel(xls, 'P')
     required_cols_p = {'j', 'o', 'P'}
@@ -11,16 +52,19 @@ def read_parameters_from_excel(file_path: str):
 
     num_jobs = int(df_p['j'].max())
     num_ops  = int(df_p['o'].max())
+    op_ids = np.arange(1, num_ops + 1)
 
-    processing_times = {}
-    for o in range(1, num_ops + 1):
-        row_list = []
-        for j in range(1, num_jobs + 1):
-            vals = df_p[(df_p['j'] == j) & (df_p['o'] == o)]['P'].values
-            if len(vals) == 0:
-                raise ValueError(f"Missing processing time for (j={j}, o={o})")
-            row_list.append(float(vals[0]))
-        processing_times[o] = row_list
+    # First row wins for duplicated (j, o), as with the old per-pair mask.
+    p_first = df_p.drop_duplicates(subset=['j', 'o'], keep='first')
+    time_table = (
+        p_first.pivot(index='o', columns='j', values='P')
+        .reindex(index=op_ids, columns=range(1, num_jobs + 1))
+        .to_numpy(dtype=float)
+    )
+    missing = np.argwhere(np.isnan(time_table))
+    if len(missing):
+        o_idx, j_idx = missing[0]
+        raise ValueError(f"Missing processing time for (j={j_idx + 1}, o={o_idx + 1})")
 
     df_m = pd.read_excel(xls, 'M')
     required_cols_m = {'j', 'o'}
@@ -28,45 +72,117 @@ def read_parameters_from_excel(file_path: str):
         raise ValueError(f"'M' sheet must contain columns: {required_cols_m}")
 
     machine_cols = [c for c in df_m.columns if c not in ('j', 'o')]
+    norm_machine_ids = np.array([_parse_machine_id(c) for c in machine_cols], dtype=np.int64)
+
+    # Later rows overwrite earlier ones for duplicated (j, o), as before.
+    df_m = df_m.drop_duplicates(subset=['j', 'o'], keep='last')
+    flags = df_m[machine_cols].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+    is_one = np.trunc(flags) == 1
+    has_machine = is_one.any(axis=1)
+    jobs = df_m['j'].to_numpy().astype(int)
+    ops = df_m['o'].to_numpy().astype(int)
+    if not has_machine.all():
+        k = int(np.argmin(has_machine))
+        raise ValueError(f"No machine assigned for (j={jobs[k]}, o={ops[k]}) in 'M' sheet")
+
+    machine_table = np.full((num_ops, num_jobs), -1, dtype=np.int64)
+    machine_table[ops - 1, jobs - 1] = norm_machine_ids[is_one.argmax(axis=1)]
+    eligibility = np.zeros((num_ops, num_jobs, len(norm_machine_ids)), dtype=bool)
+    eligibility[ops - 1, jobs - 1] = is_one
+    return op_ids, machine_table, time_table, norm_machine_ids, eligibility
+
+
+def _to_dicts(op_ids, machine_table, time_table):
+    machines = {
+        int(o): [int(m) if m >= 0 else None for m in row]
+        for o, row in zip(op_ids, machine_table)
+    }
+    processing_times = {int(o): [float(p) for p in row] for o, row in zip(op_ids, time_table)}
+    return machines, processing_times
+
 
-    norm_machine_ids = []
-    for c in machine_cols:
-        try:
-            norm_machine_ids.append(int(c))
-        except Exception:
-            digits = re.findall(r"\d+", str(c))
-            if not digits:
-                raise ValueError(f"Cannot parse machine id from column '{c}'")
-            norm_machine_ids.append(int(digits[-1]))
-
-    machines = {o: [None] * num_jobs for o in range(1, num_ops + 1)}
-    for _, r in df_m.iterrows():
-        j = int(r['j']); o = int(r['o'])
-        assigned = None
-        for col_name, mid in zip(machine_cols, norm_machine_ids):
-            try:
-                is_one = int(r[col_name]) == 1
-            except Exception:
-                is_one = False
-            if is_one:
-                assigned = mid
-                break
-        if assigned is None:
-            raise ValueError(f"No machine assigned for (j={j}, o={o}) in 'M' sheet")
-        machines[o][j - 1] = assigned
-
-    def build_order(machines_dict):
-        machine_count = defaultdict(int)
-        for op in sorted(machines_dict.keys()):
-            for m in machines_dict[op]:
-                machine_count[m] += 1
-        order = []
-        for m, count in machine_count.items():
-            order.extend([m] * count)
-        return order
+def default_cache_dir() -> Path:
+    env = os.environ.get(CACHE_ENV)
+    if env:
+        return Path(env)
+    return Path.home() / ".cache" / "fjssp_ga_cplex"
 
+
+def _content_key(file_path: str) -> str:
+    h = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return f"{h.hexdigest()}.v{CACHE_FORMAT}"
+
+
+def _load_cached(path: Path):
+    """Cached arrays, or ``None`` if the entry is unreadable (it is then rebuilt)."""
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            return (data["op_ids"], data["machines"], data["processing_times"],
+                    data["machine_ids"], data["eligibility"])
+    except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile, zlib.error):
+        return None
+
+
+def _store_cached(path: Path, op_ids, machine_table, time_table, machine_ids, eligibility):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp.npz")
+        np.savez_compressed(tmp, op_ids=op_ids, machines=machine_table, processing_times=time_table,
+                            machine_ids=machine_ids, eligibility=eligibility)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _read_arrays(file_path, cache, cache_dir):
+    arrays = None
+    cache_path = None
+    if cache:
+        cache_path = Path(cache_dir or default_cache_dir()) / f"{_content_key(file_path)}.npz"
+        if cache_path.exists():
+            arrays = _load_cached(cache_path)
+    if arrays is None:
+        arrays = _parse_excel(file_path)
+        if cache_path is not None:
+            _store_cached(cache_path, *arrays)
+    return arrays
+
+
+def read_parameters_from_excel(file_path: str, cache: bool = True,
+                               cache_dir: Optional[Union[str, Path]] = None):
+    """Read ``machines``, ``processing_times`` and ``order`` from the workbook.
+
+    Each operation keeps only its first eligible machine (fixed routing);
+    see :func:`read_flexible_parameters` for all of them.
+
+    With ``cache`` on, the parsed arrays are stored as ``.npz`` under
+    ``cache_dir`` (default ``$FJSSP_GA_CACHE_DIR`` or
+    ``~/.cache/fjssp_ga_cplex``), keyed by the SHA-256 of the file, so later
+    reads of the same workbook skip pandas/openpyxl entirely.
+    """
+    op_ids, machine_table, time_table, _, _ = _read_arrays(file_path, cache, cache_dir)
+    machines, processing_times = _to_dicts(op_ids, machine_table, time_table)
     order = build_order(machines)
     return machines, processing_times, order
 
-def read_data(file_path: str):
-    return read_parameters_from_excel(file_path)
+
+def read_flexible_parameters(file_path: str, cache: bool = True,
+                             cache_dir: Optional[Union[str, Path]] = None):
+    """Read ``eligible`` and ``processing_times`` for the flexible GA.
+
+    ``eligible`` maps ``(j, o)`` to every machine id marked 1 in ``M`` (in
+    sheet column order); ``processing_times`` is the usual ``{o: [p_j]}``.
+    """
+    op_ids, _, time_table, machine_ids, eligibility = _read_arrays(file_path, cache, cache_dir)
+    processing_times = {int(o): [float(p) for p in row] for o, row in zip(op_ids, time_table)}
+    eligible = {}
+    for o_idx, j_idx in zip(*np.nonzero(eligibility.any(axis=2))):
+        ks = np.flatnonzero(eligibility[o_idx, j_idx])
+        eligible[(int(j_idx) + 1, int(op_ids[o_idx]))] = [int(machine_ids[k]) for k in ks]
+    return eligible, processing_times
+
+def read_data(file_path: str, **kwargs):
+    return read_parameters_from_excel(file_path, **kwargs)
@@ -0,0 +1,169 @@
+import random
+from contextlib import nullcontext
+
+from .instance import compile_instance
+from .fitness import FitnessCache, evaluate_population
+from .history import make_history
+from .stopping import StoppingRule
+from .chromosome import generate_population
+from .dispatching import RULES
+from .ga import evolve, _check_fitness_decoder
+
+__all__ = ["island_genetic_algorithm", "migration_targets"]
+
+TOPOLOGIES = ("ring", "full")
+
+
+def _run_epoch(population, rng_state, generations, mutation_rate, mutation_tries, crossover,
+               neighborhood, instance, fitness):
+    """Evolve one island for ``generations`` steps from a saved RNG state."""
+    random.setstate(rng_state)
+    history = []
+    for _ in range(generations):
+        population = evolve(population, instance, mutation_rate, fitness,
+                            mutation_tries=mutation_tries, crossover=crossover,
+                            neighborhood=neighborhood)
+        scores = evaluate_population(population, instance, fitness)
+        best_idx = min(range(len(population)), key=scores.__getitem__)
+        history.append((scores[best_idx], population[best_idx]))
+    scores = evaluate_population(population, instance, fitness)
+    return population, scores, history, random.getstate()
+
+
+def _epoch_task(task):
+    from . import parallel
+    return _run_epoch(*task, parallel._worker_instance, parallel._worker_fitness)
+
+
+def migration_targets(island, num_islands, topology):
+    if topology == "ring":
+        return [(island + 1) % num_islands] if num_islands > 1 else []
+    if topology == "full":
+        return [k for k in range(num_islands) if k != island]
+    raise ValueError(f"Unknown topology: {topology} (expected one of {TOPOLOGIES})")
+
+
+def _migrate(populations, scores, migrants, topology):
+    """Copy each island's best ``migrants`` over the worst of its targets."""
+    k = len(populations)
+    ranked = [sorted(range(len(pop)), key=sc.__getitem__) for pop, sc in zip(populations, scores)]
+    emigrants = [[(scores[i][r], populations[i][r]) for r in ranked[i][:migrants]] for i in range(k)]
+
+    incoming = [[] for _ in range(k)]
+    for i in range(k):
+        for target in migration_targets(i, k, topology):
+            incoming[target].extend(emigrants[i])
+
+    for target in range(k):
+        pop, sc = populations[target], scores[target]
+        present = {tuple(ch) for ch in pop}
+        worst = ranked[target][::-1]
+        slot = 0
+        for value, chrom in sorted(incoming[target], key=lambda x: x[0]):
+            if slot >= len(worst) - migrants:
+                break
+            key = tuple(chrom)
+            if key in present:
+                continue
+            pos = worst[slot]
+            if value >= sc[pos]:
+                continue
+            present.discard(tuple(pop[pos]))
+            pop[pos], sc[pos] = list(chrom), value
+            present.add(key)
+            slot += 1
+
+
+def island_genetic_algorithm(machines, processing_times, order, population_size, generations, mutation_rate,
+                             islands=4, migration_interval=10, migrants=1, topology="ring",
+                             instance=None, fitness=None, cache_size=100_000, processes=None,
+                             mutation_tries=1, crossover="one_point", history=None, stop=None,
+                             decoder="semi_active", neighborhood=None, seed_fraction=0.0,
+                             seed_rules=RULES):
+    """Island-model GA: ``islands`` sub-populations evolved in separate processes.
+
+    Each island runs the usual select/crossover/mutate loop on its own
+    ``population_size`` individuals. Every ``migration_interval`` generations
+    the best ``migrants`` of each island replace the worst individuals of its
+    neighbours (``topology`` is ``"ring"`` or ``"full"``). Island RNG streams
+    are seeded from the global ``random`` module, so ``random.seed`` makes a
+    run reproducible. ``processes=0`` runs the islands in-process, sharing
+    ``fitness``; otherwise each worker keeps its own cache.
+
+    ``decoder`` (``"semi_active"`` or ``"active"``) and the mutation
+    ``neighborhood`` apply to every island, and each island seeds
+    ``seed_fraction`` of its population with ``seed_rules``.
+
+    ``stop`` is checked after every generation, but islands only return to
+    the parent at migration points, so time limits are honoured with the
+    granularity of one ``migration_interval``.
+
+    Returns the same tuple as ``genetic_algorithm``; ``makespan_history`` and
+    the recorded ``history`` follow the best individual over all islands.
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown topology: {topology} (expected one of {TOPOLOGIES})")
+    if islands < 1 or migration_interval < 1:
+        raise ValueError("islands and migration_interval must be >= 1")
+    if instance is None:
+        instance = compile_instance(machines, processing_times)
+    if fitness is None:
+        fitness = FitnessCache(instance, capacity=cache_size, decoder=decoder)
+    _check_fitness_decoder(fitness, decoder)
+    history = make_history(instance, history, decoder)
+    if stop is None:
+        stop = StoppingRule(generations=generations)
+    elif stop.generations is None:
+        stop.generations = generations
+    if not stop.bounded():
+        raise ValueError("GA needs generations, time_limit or max_stagnation "
+                         "(or a callback with callback_bounds=True)")
+    stop.start()
+
+    populations = [generate_population(instance, order, population_size, seed_fraction, seed_rules)
+                   for _ in range(islands)]
+    rng_states = [random.Random(random.getrandbits(64)).getstate() for _ in range(islands)]
+
+    makespan_history = []
+    if processes is None:
+        processes = islands
+    pool_context = nullcontext()
+    if processes > 0:
+        import multiprocessing
+        from . import parallel
+        # Workers ignore SIGINT and leaving the block terminates them, so an
+        # error or Ctrl-C in the parent never waits on a running epoch.
+        pool_context = multiprocessing.Pool(processes=processes, initializer=parallel._init_process,
+                                            initargs=(instance, cache_size, decoder))
+    with pool_context as pool:
+        done = 0
+        while not stop.exhausted():
+            step = migration_interval
+            if stop.generations is not None:
+                step = min(step, stop.generations - done)
+            tasks = [(populations[i], rng_states[i], step, mutation_rate, mutation_tries, crossover,
+                      neighborhood) for i in range(islands)]
+            if pool is not None:
+                results = pool.map(_epoch_task, tasks, chunksize=1)
+            else:
+                saved = random.getstate()
+                results = [_run_epoch(*task, instance, fitness) for task in tasks]
+                random.setstate(saved)
+            populations = [r[0] for r in results]
+            scores = [r[1] for r in results]
+            rng_states = [r[3] for r in results]
+
+            for g in range(step):
+                value, chrom = min((r[2][g] for r in results), key=lambda x: x[0])
+                makespan_history.append(value)
+                history.record(done + g, chrom, value)
+                if stop.update(done + g, chrom, value):
+                    break
+            done += step
+            if not stop.exhausted() and islands > 1:
+                _migrate(populations, scores, migrants, topology)
+
+    candidates = [ch for pop in populations for ch in pop]
+    final_scores = evaluate_population(candidates, instance, fitness)
+    best_idx = min(range(len(candidates)), key=final_scores.__getitem__)
+    return candidates[best_idx], final_scores[best_idx], makespan_history, history.finish()
@@ -1,47 +1,177 @@
 # ga/mainga.py
+import random
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Sequence, Union
 
-from .io import read_parameters_from_excel
+from .io import read_parameters_from_excel, read_flexible_parameters
+from .instance import compile_instance
+from .fitness import FitnessCache
+from .history import BestHistory
+from .dispatching import RULES, check_rules
+from .checkpoint import Checkpoint
+from .stopping import StoppingRule
 from .ga import genetic_algorithm
-from .utils import generate_color_map
-from .viz import (
-    animate_gantt_and_makespan,
-    plot_makespan_history,
-    chromosome_gantt_chart,
+from .islands import island_genetic_algorithm
+from .steady_state import steady_state_genetic_algorithm
+from .flexible import (
+    compile_flexible_instance,
+    flexible_genetic_algorithm,
+    flexible_makespan_function,
+    flexible_operation_details,
 )
 
 def ga_optimize(
     data_path: Optional[str] = None,
     population_size: int = 10,
-    generations: int = 50,
+    generations: Optional[int] = 50,
     mutation_rate: float = 0.1,
     visualize: bool = False,
+    cache_size: Optional[int] = 100_000,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    islands: Optional[int] = None,
+    migration_interval: int = 10,
+    migrants: int = 1,
+    topology: str = "ring",
+    mutation_tries: int = 1,
+    crossover: str = "one_point",
+    history_policy: Optional[str] = None,
+    history_interval: int = 1,
+    history_capacity: Optional[int] = None,
+    time_limit: Optional[float] = None,
+    target_makespan: Optional[float] = None,
+    max_stagnation: Optional[int] = None,
+    lower_bound: Union[float, str, None] = None,
+    callback: Optional[Callable[[Dict[str, Any]], Optional[bool]]] = None,
+    callback_bounds: bool = False,
+    data_cache: bool = True,
+    decoder: str = "semi_active",
+    neighborhood: Optional[str] = None,
+    animation_path: Optional[str] = None,
+    animation_fps: int = 10,
+    seed_fraction: float = 0.0,
+    seed_rules: Sequence[str] = RULES,
+    steady_state: bool = False,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_interval: int = 10,
+    resume: bool = False,
+    flexible: bool = False,
 ) -> Dict[str, Any]:
     if data_path is None:
         here = Path(__file__).resolve().parent
         data_path = str((here.parent / "data" / "Data.xlsx").resolve())
 
-    machines, processing_times, order = read_parameters_from_excel(data_path)
-    best_chrom, best_mk, mk_hist, det_hist = genetic_algorithm(
-        machines, processing_times, order, population_size, generations, mutation_rate
-    )
+    seed_rules = check_rules(seed_rules)
+    if steady_state and islands:
+        raise ValueError("steady_state cannot be combined with islands")
+    if steady_state and (workers or 0) > 1:
+        raise ValueError("steady_state runs in-process; it cannot use workers > 1")
+    if checkpoint_path and islands:
+        raise ValueError("checkpointing is not supported for the island model")
+    if flexible and (islands or steady_state or checkpoint_path or neighborhood
+                     or seed_fraction or (workers or 0) > 1 or crossover != "one_point"):
+        raise ValueError("flexible runs the generational GA in-process only (no islands, "
+                         "steady_state, checkpoint, neighborhood, seeding, workers or "
+                         "crossover choice; it always uses uniform + POX crossover)")
+    if animation_path:
+        # Fail before the run rather than after it when the writer is missing.
+        from .viz import check_animation_writer
+        check_animation_writer(animation_path)
+    if seed is not None:
+        random.seed(seed)
+
+    if history_policy is None:
+        history_policy = "all" if visualize or animation_path else "none"
+    if flexible:
+        eligible, processing_times = read_flexible_parameters(data_path, cache=data_cache)
+        instance = compile_flexible_instance(eligible, processing_times)
+        fitness = FitnessCache(instance, capacity=cache_size, decoder=decoder,
+                               evaluate=flexible_makespan_function(decoder))
+        history = BestHistory(instance, policy=history_policy, interval=history_interval,
+                              capacity=history_capacity, decoder=decoder,
+                              details=flexible_operation_details)
+    else:
+        machines, processing_times, order = read_parameters_from_excel(data_path, cache=data_cache)
+        instance = compile_instance(machines, processing_times)
+        fitness = FitnessCache(instance, capacity=cache_size, decoder=decoder)
+        history = BestHistory(instance, policy=history_policy, interval=history_interval,
+                              capacity=history_capacity, decoder=decoder)
+    checkpoint = Checkpoint(checkpoint_path, checkpoint_interval) if checkpoint_path else None
+    if lower_bound == "auto":
+        lower_bound = instance.lower_bound()
+    stop = StoppingRule(generations=generations, time_limit=time_limit,
+                        target_makespan=target_makespan, max_stagnation=max_stagnation,
+                        lower_bound=lower_bound, callback=callback,
+                        callback_bounds=callback_bounds)
+    if flexible:
+        best_chrom, best_mk, mk_hist, det_hist = flexible_genetic_algorithm(
+            instance, population_size, generations, mutation_rate, fitness=fitness,
+            history=history, stop=stop, decoder=decoder, mutation_tries=mutation_tries,
+        )
+    elif islands:
+        best_chrom, best_mk, mk_hist, det_hist = island_genetic_algorithm(
+            machines, processing_times, order, population_size, generations, mutation_rate,
+            islands=islands, migration_interval=migration_interval, migrants=migrants,
+            topology=topology, instance=instance, fitness=fitness, cache_size=cache_size,
+            processes=workers, mutation_tries=mutation_tries, crossover=crossover,
+            history=history, stop=stop, decoder=decoder, neighborhood=neighborhood,
+            seed_fraction=seed_fraction, seed_rules=seed_rules,
+        )
+    elif steady_state:
+        best_chrom, best_mk, mk_hist, det_hist = steady_state_genetic_algorithm(
+            machines, processing_times, order, population_size, generations, mutation_rate,
+            instance=instance, fitness=fitness, mutation_tries=mutation_tries, crossover=crossover,
+            history=history, stop=stop, decoder=decoder, neighborhood=neighborhood,
+            seed_fraction=seed_fraction, seed_rules=seed_rules, checkpoint=checkpoint, resume=resume,
+        )
+    else:
+        best_chrom, best_mk, mk_hist, det_hist = genetic_algorithm(
+            machines, processing_times, order, population_size, generations, mutation_rate,
+            instance=instance, fitness=fitness, workers=workers, mutation_tries=mutation_tries,
+            crossover=crossover, history=history, stop=stop, decoder=decoder,
+            neighborhood=neighborhood, seed_fraction=seed_fraction, seed_rules=seed_rules,
+            checkpoint=checkpoint, resume=resume, cache_size=cache_size,
+        )
 
     if visualize:
         try:
-            import matplotlib.pyplot as plt
-            num_jobs = max(len(machine_list) for machine_list in machines.values())
-            color_map = generate_color_map(num_jobs)
-            animate_gantt_and_makespan(det_hist, mk_hist, color_map, len(det_hist))
+            from .utils import generate_color_map
+            from .viz import (
+                animate_gantt_and_makespan,
+                plot_makespan_history,
+                chromosome_gantt_chart,
+                schedule_gantt_chart,
+            )
+            color_map = generate_color_map(instance.num_jobs)
+            animate_gantt_and_makespan(det_hist, mk_hist, color_map, len(det_hist),
+                                       machine_ids=instance.machine_ids)
             plot_makespan_history(mk_hist)
-            chromosome_gantt_chart(best_chrom, machines, processing_times)
+            if flexible:
+                schedule_gantt_chart(flexible_operation_details(best_chrom, instance, decoder),
+                                     instance.num_jobs)
+            else:
+                chromosome_gantt_chart(best_chrom, machines, processing_times, decoder=decoder)
         except Exception as e:
             print(f"[WARN] Visualization skipped: {e}")
 
+    if animation_path:
+        from .utils import generate_color_map
+        from .viz import animate_gantt_and_makespan
+        animate_gantt_and_makespan(det_hist, mk_hist, generate_color_map(instance.num_jobs),
+                                   len(det_hist), save_path=animation_path, fps=animation_fps,
+                                   machine_ids=instance.machine_ids)
+
     return {
         "best_chromosome": best_chrom,
         "best_makespan": best_mk,
         "makespan_history": mk_hist,
         "details_history": det_hist,
         "data_path": data_path,
+        "instance": instance,
+        "fitness_stats": fitness.stats(),
+        "stop_reason": stop.reason,
+        "generations_run": stop.completed,
+        "elapsed": stop.elapsed,
+        "decoder": decoder,
+        "flexible": flexible,
     }
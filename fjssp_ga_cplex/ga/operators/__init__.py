@@ -1,4 +1,10 @@
-from .crossover import pair_crossover
+from .crossover import (
+    pair_crossover,
+    one_point_crossover,
+    pox_crossover,
+    order_crossover,
+    CROSSOVERS,
+)
 from .mutation import individual_mutate, mutate
 from .selection import select
 from .pairing import divide_into_pairs
@@ -6,6 +12,10 @@ from .repair import fix_duplicates
 
 __all__ = [
     "pair_crossover",
+    "one_point_crossover",
+    "pox_crossover",
+    "order_crossover",
+    "CROSSOVERS",
     "individual_mutate",
     "mutate",
     "select",
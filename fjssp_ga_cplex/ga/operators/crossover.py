@@ -3,20 +3,74 @@ from ..schedule import calculate_makespan
 from .repair import fix_duplicates
 
 
-def pair_crossover(cross_pair, machines, processing_times):
-    p1, p2 = cross_pair
+def one_point_crossover(p1, p2, instance):
     n = len(p1)
     if n <= 2:
         point = 1
     else:
         point = random.randint(1, n - 1)
 
-    c1 = fix_duplicates(p1[:point] + p2[point:], machines)
-    c2 = fix_duplicates(p2[:point] + p1[point:], machines)
+    c1 = fix_duplicates(p1[:point] + p2[point:], instance)
+    c2 = fix_duplicates(p2[:point] + p1[point:], instance)
+    return c1, c2
+
+
+def pox_crossover(p1, p2, instance):
+    """Precedence-preserving operation crossover (POX/JOX).
+
+    A random subset of jobs keeps its positions from one parent; the
+    remaining positions take the other jobs' operations in the order they
+    appear in the other parent. Children are always valid permutations.
+    """
+    num_jobs = instance.num_jobs
+    if num_jobs < 2:
+        return p1[:], p2[:]
+    kept = set(random.sample(range(num_jobs), random.randint(1, num_jobs - 1)))
+    op_job = instance.op_job
+
+    def child(a, b):
+        fill = iter([op for op in b if op_job[op] not in kept])
+        return [op if op_job[op] in kept else next(fill) for op in a]
+
+    return child(p1, p2), child(p2, p1)
+
+
+def order_crossover(p1, p2, instance):
+    """Order crossover (OX): keep a slice of one parent, fill the rest in the other's order."""
+    n = len(p1)
+    if n < 2:
+        return p1[:], p2[:]
+    a, b = sorted(random.sample(range(n + 1), 2))
+
+    def child(x, y):
+        segment = x[a:b]
+        kept = set(segment)
+        fill = [op for op in y if op not in kept]
+        return fill[:a] + segment + fill[a:]
+
+    return child(p1, p2), child(p2, p1)
+
+
+CROSSOVERS = {
+    "one_point": one_point_crossover,
+    "pox": pox_crossover,
+    "ox": order_crossover,
+}
+
+
+def pair_crossover(cross_pair, instance, fitness=None, method="one_point"):
+    if fitness is None:
+        fitness = lambda ch: calculate_makespan(ch, instance)
+    try:
+        crossover = CROSSOVERS[method]
+    except KeyError:
+        raise ValueError(f"Unknown crossover: {method} (expected one of {sorted(CROSSOVERS)})")
+    p1, p2 = cross_pair
+    c1, c2 = crossover(p1, p2, instance)
 
     candidates = [p1, p2, c1, c2]
     scored = sorted(
-        ((calculate_makespan(ch, machines, processing_times), tuple(ch)) for ch in candidates),
+        ((fitness(ch), tuple(ch)) for ch in candidates),
         key=lambda x: x[0]
     )
     best = [list(scored[0][1])]
@@ -1,43 +1,85 @@
 import random
 from collections import defaultdict
-from ..schedule import calculate_makespan
-from ..gene import parse_gene
+from ..schedule import calculate_makespan, swap_makespans
+from ..critical import CriticalPath
 
 
-def _positions_by_machine(chromosome, machines):
+def _positions_by_machine(chromosome, instance):
+    op_machine = instance.op_machine
     pos_by_machine = defaultdict(list)
-    for idx, gene in enumerate(chromosome):
-        try:
-            j, o = parse_gene(gene)
-            m_id = machines[o][j - 1]
-            pos_by_machine[m_id].append(idx)
-        except Exception:
-            continue
+    for idx, op in enumerate(chromosome):
+        pos_by_machine[op_machine[op]].append(idx)
     return {m: idxs for m, idxs in pos_by_machine.items() if len(idxs) >= 2}
 
 
-def individual_mutate(chromosome, machines, processing_times):
-    shared = _positions_by_machine(chromosome, machines)
+def _swapped(chromosome, i, j):
+    child = chromosome[:]
+    child[i], child[j] = child[j], child[i]
+    return child
+
+
+def _critical_mutate(chromosome, instance, fitness, tries, neighborhood):
+    """Best of the ``tries`` critical-block moves with the lowest estimates."""
+    path = CriticalPath(chromosome, instance, getattr(fitness, "decoder", "semi_active"))
+    scored = path.scored_moves(neighborhood)
+    random.shuffle(scored)
+    scored.sort(key=lambda move: move[0])
+
+    best, best_value = chromosome[:], fitness(chromosome)
+    for _, u, v in scored[:max(1, tries)]:
+        child = path.apply(u, v)
+        if child is None:
+            continue
+        value = fitness(child)
+        if value < best_value:
+            best, best_value = child, value
+    return best
+
+
+def individual_mutate(chromosome, instance, fitness=None, tries=1, neighborhood=None):
+    """Swap two genes on the same machine; keep the child only if it is better.
+
+    With ``tries > 1`` that many random swaps are scored together against
+    one decode of the shared prefix (``swap_makespans``) and the best is kept.
+    An active-decoder ``fitness`` has no prefix shortcut, so each candidate
+    is scored through ``fitness`` itself.
+
+    ``neighborhood="n5"``/``"n7"`` replaces the random pairs with moves at
+    the critical blocks of the decoded schedule (see ``ga.critical``): the
+    ``tries`` moves with the best estimates are decoded exactly.
+    """
+    if fitness is None:
+        fitness = lambda ch: calculate_makespan(ch, instance)
+    if neighborhood is not None:
+        return _critical_mutate(chromosome, instance, fitness, tries, neighborhood)
+    shared = _positions_by_machine(chromosome, instance)
     if not shared:
         return chromosome
 
-    m = random.choice(list(shared.keys()))
-    idx1, idx2 = random.sample(shared[m], 2)
+    machines = list(shared.keys())
+    moves = []
+    for _ in range(max(1, tries)):
+        m = random.choice(machines)
+        moves.append(tuple(random.sample(shared[m], 2)))
+    if getattr(fitness, "decoder", "semi_active") == "semi_active":
+        scores = swap_makespans(chromosome, moves, instance)
+    else:
+        scores = [fitness(_swapped(chromosome, i, j)) for i, j in moves]
+    best = min(range(len(moves)), key=scores.__getitem__)
 
     parent = chromosome[:]
-    child = parent[:]
-    child[idx1], child[idx2] = child[idx2], child[idx1]
+    if scores[best] >= fitness(parent):
+        return parent
 
-    return (
-        child
-        if calculate_makespan(child, machines, processing_times)
-        < calculate_makespan(parent, machines, processing_times)
-        else parent
-    )
+    child = _swapped(parent, *moves[best])
+    add = getattr(fitness, "add", None)
+    if add is not None:
+        add(child, scores[best])
+    return child
 
 
-def mutate(mutation_list, machines, processing_times):
+def mutate(mutation_list, instance, fitness=None, tries=1, neighborhood=None):
     return [
-        individual_mutate(ch, machines, processing_times)
+        individual_mutate(ch, instance, fitness, tries, neighborhood)
         for ch in mutation_list
     ]
@@ -1,8 +1,8 @@
 from collections import defaultdict
 
 
-def fix_duplicates(chromosome, machines):
-    required = {f"J{j+1}O{o}" for o, mlist in machines.items() for j in range(len(mlist))}
+def fix_duplicates(chromosome, instance):
+    required = set(range(instance.num_operations))
     cnt = defaultdict(int)
     for g in chromosome:
         cnt[g] += 1
@@ -1,11 +1,9 @@
-from ..schedule import calculate_makespan
+from ..fitness import evaluate_population
 
 
-def select(population, machines, processing_times, num_selected):
-    evaluated = sorted(
-        ((calculate_makespan(ch, machines, processing_times), ch) for ch in population),
-        key=lambda x: x[0],
-    )
+def select(population, instance, num_selected, fitness=None):
+    scores = evaluate_population(population, instance, fitness)
+    evaluated = sorted(zip(scores, population), key=lambda x: x[0])
     return (
         [ch for _, ch in evaluated[:num_selected]],
         [ch for _, ch in evaluated[num_selected:]],
@@ -0,0 +1,123 @@
+import random
+import signal
+import multiprocessing
+
+from .fitness import FitnessCache
+from .schedule import calculate_makespans
+from .operators import pair_crossover, individual_mutate
+
+__all__ = ["WorkerPool"]
+
+# Per-process state, set once by ``_init_worker`` so tasks only carry
+# chromosomes and seeds, never the instance itself.
+_worker_instance = None
+_worker_fitness = None
+
+
+def _init_worker(instance, cache_size, decoder):
+    global _worker_instance, _worker_fitness
+    _worker_instance = instance
+    _worker_fitness = FitnessCache(instance, capacity=cache_size, decoder=decoder)
+
+
+def _init_process(instance, cache_size, decoder):
+    """Pool initializer: leave Ctrl-C to the parent, which terminates the pool."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _init_worker(instance, cache_size, decoder)
+
+
+def _makespans_task(chunk):
+    return calculate_makespans(chunk, _worker_instance, _worker_fitness.decoder).tolist()
+
+
+def _crossover_task(task):
+    pair, method, seed = task
+    random.seed(seed)
+    children = pair_crossover(pair, _worker_instance, _worker_fitness, method)
+    return [(child, _worker_fitness(child)) for child in children]
+
+
+def _mutate_task(task):
+    chromosome, tries, neighborhood, seed = task
+    random.seed(seed)
+    child = individual_mutate(chromosome, _worker_instance, _worker_fitness, tries, neighborhood)
+    return child, _worker_fitness(child)
+
+
+class WorkerPool:
+    """Process pool that runs GA evaluation and variation off the main process.
+
+    The instance is shipped to each worker once, through the pool
+    initializer. Every crossover/mutation task gets its own seed drawn from
+    one master ``random.Random(seed)`` stream in the parent, so a run is
+    reproducible for a given seed whatever the worker count or the order in
+    which workers pick up tasks. ``workers=1`` runs the same seeded tasks
+    in-process (the parent's ``random`` state is left untouched), so it
+    matches any larger count.
+    """
+
+    def __init__(self, instance, workers, seed=None, cache_size=100_000, decoder="semi_active"):
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self.rng = random.Random(seed)
+        self._pool = None
+        if workers == 1:
+            _init_worker(instance, cache_size, decoder)
+        else:
+            self._pool = multiprocessing.Pool(
+                processes=workers,
+                initializer=_init_process,
+                initargs=(instance, cache_size, decoder),
+            )
+
+    def _chunksize(self, n):
+        return max(1, n // (self.workers * 4))
+
+    def _map(self, func, tasks, chunksize=1):
+        if self._pool is not None:
+            return self._pool.map(func, tasks, chunksize=chunksize)
+        # Tasks reseed the global RNG; keep the parent's stream as a pool would.
+        state = random.getstate()
+        try:
+            return [func(task) for task in tasks]
+        finally:
+            random.setstate(state)
+
+    def _seeded(self, items):
+        return [(item, self.rng.getrandbits(64)) for item in items]
+
+    def makespans(self, population):
+        population = [list(ch) for ch in population]
+        if not population:
+            return []
+        size = -(-len(population) // self.workers)
+        chunks = [population[i:i + size] for i in range(0, len(population), size)]
+        return [v for part in self._map(_makespans_task, chunks) for v in part]
+
+    def crossover(self, pairs, method="one_point"):
+        """``pair_crossover`` over all pairs; returns ``(child, makespan)`` tuples."""
+        tasks = [(pair, method, seed) for pair, seed in self._seeded(pairs)]
+        results = self._map(_crossover_task, tasks, self._chunksize(len(tasks)))
+        return [scored for children in results for scored in children]
+
+    def mutate(self, chromosomes, tries=1, neighborhood=None):
+        """``individual_mutate`` over all chromosomes; returns ``(child, makespan)`` tuples."""
+        tasks = [(ch, tries, neighborhood, seed) for ch, seed in self._seeded(chromosomes)]
+        return self._map(_mutate_task, tasks, self._chunksize(len(tasks)))
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if exc[0] is None or self._pool is None:
+            self.close()
+        else:
+            self._pool.terminate()
+            self._pool.join()
+        return False
@@ -1,25 +1,215 @@
-from collections import defaultdict
-from .gene import parse_gene
+from bisect import bisect_right
 
-def get_operation_details(chromosome, machines, processing_times):
-    job_times, machine_times = defaultdict(float), defaultdict(float)
+import numpy as np
+
+DECODERS = ("semi_active", "active")
+
+
+def _check_decoder(decoder):
+    if decoder not in DECODERS:
+        raise ValueError(f"Unknown decoder: {decoder} (expected one of {DECODERS})")
+
+
+def _insert_active(starts, ends, ready, duration):
+    """Place an operation in the earliest idle interval of one machine.
+
+    ``starts``/``ends`` are the machine's idle intervals, sorted and
+    disjoint, the last one open-ended. Intervals ending at or before
+    ``ready`` are skipped by binary search; the chosen interval is split
+    around the operation. Returns the start time.
+    """
+    k = bisect_right(ends, ready)
+    while True:
+        start = starts[k]
+        if start < ready:
+            start = ready
+        end = start + duration
+        if end <= ends[k]:
+            break
+        k += 1
+    gap_start, gap_end = starts[k], ends[k]
+    if start > gap_start:
+        ends[k] = start
+        if end < gap_end:
+            starts.insert(k + 1, end)
+            ends.insert(k + 1, gap_end)
+    elif end < gap_end:
+        starts[k] = end
+    else:
+        del starts[k], ends[k]
+    return start
+
+
+def _active_gaps(instance):
+    inf = float('inf')
+    return [[0.0] for _ in range(instance.num_machines)], [[inf] for _ in range(instance.num_machines)]
+
+
+def active_operation_details(chromosome, instance):
+    """Active decode: each operation goes into the earliest idle gap on its machine
+    that opens after its job is ready, instead of after the machine's last operation."""
+    op_job, op_machine, op_duration = instance.op_job, instance.op_machine, instance.op_duration
+    job_times = [0.0] * instance.num_jobs
+    gap_starts, gap_ends = _active_gaps(instance)
     operation_details = []
-    for gene in chromosome:
-        try:
-            j, o = parse_gene(gene)
-            machine_id = machines[o][j - 1]
-            start_time = max(job_times[f'J{j}'], machine_times[machine_id])
-            duration = processing_times[o][j - 1]
-            end_time = start_time + duration
-            job_times[f'J{j}'] = end_time
-            machine_times[machine_id] = end_time
-            operation_details.append((gene, machine_id, start_time, end_time, duration))
-        except Exception:
-            continue
+    for op in chromosome:
+        j, m = op_job[op], op_machine[op]
+        duration = op_duration[op]
+        start_time = _insert_active(gap_starts[m], gap_ends[m], job_times[j], duration)
+        end_time = start_time + duration
+        job_times[j] = end_time
+        operation_details.append(
+            (instance.genes[op], instance.machine_ids[m], start_time, end_time, duration)
+        )
     return operation_details
 
-def calculate_makespan(chromosome, machines, processing_times):
-    operation_details = get_operation_details(chromosome, machines, processing_times)
-    if not operation_details:
+
+def active_makespan(chromosome, instance):
+    if not chromosome:
         return float('inf')
-    return max(end for _, _, _, end, _ in operation_details)
+    op_job, op_machine, op_duration = instance.op_job, instance.op_machine, instance.op_duration
+    job_times = [0.0] * instance.num_jobs
+    gap_starts, gap_ends = _active_gaps(instance)
+    makespan = 0.0
+    for op in chromosome:
+        j, m = op_job[op], op_machine[op]
+        end_time = _insert_active(gap_starts[m], gap_ends[m], job_times[j], op_duration[op]) + op_duration[op]
+        job_times[j] = end_time
+        if end_time > makespan:
+            makespan = end_time
+    return makespan
+
+
+def get_operation_details(chromosome, instance, decoder="semi_active"):
+    if decoder != "semi_active":
+        _check_decoder(decoder)
+        return active_operation_details(chromosome, instance)
+    op_job, op_machine, op_duration = instance.op_job, instance.op_machine, instance.op_duration
+    job_times = [0.0] * instance.num_jobs
+    machine_times = [0.0] * instance.num_machines
+    operation_details = []
+    for op in chromosome:
+        j, m = op_job[op], op_machine[op]
+        start_time = max(job_times[j], machine_times[m])
+        duration = op_duration[op]
+        end_time = start_time + duration
+        job_times[j] = end_time
+        machine_times[m] = end_time
+        operation_details.append(
+            (instance.genes[op], instance.machine_ids[m], start_time, end_time, duration)
+        )
+    return operation_details
+
+def calculate_makespan(chromosome, instance, decoder="semi_active"):
+    if decoder != "semi_active":
+        _check_decoder(decoder)
+        return active_makespan(chromosome, instance)
+    if not chromosome:
+        return float('inf')
+    op_job, op_machine, op_duration = instance.op_job, instance.op_machine, instance.op_duration
+    job_times = [0.0] * instance.num_jobs
+    machine_times = [0.0] * instance.num_machines
+    makespan = 0.0
+    for op in chromosome:
+        j, m = op_job[op], op_machine[op]
+        start_time = job_times[j]
+        if machine_times[m] > start_time:
+            start_time = machine_times[m]
+        end_time = start_time + op_duration[op]
+        job_times[j] = end_time
+        machine_times[m] = end_time
+        if end_time > makespan:
+            makespan = end_time
+    return makespan
+
+
+def makespan_function(decoder="semi_active"):
+    """The single-chromosome evaluator for ``decoder``."""
+    _check_decoder(decoder)
+    return calculate_makespan if decoder == "semi_active" else active_makespan
+
+
+def calculate_makespans(population, instance, decoder="semi_active"):
+    """Makespans of a whole population at once.
+
+    ``population`` is a 2-D integer array (individuals x gene positions).
+    Job-ready and machine-ready times are kept as arrays over the population
+    axis, so each gene position is decoded for every individual with a few
+    vectorized operations. Returns a float array equal, element for element,
+    to :func:`calculate_makespan`. The active decoder has no vectorized
+    form and is applied per individual.
+    """
+    if decoder != "semi_active":
+        _check_decoder(decoder)
+        return np.array([active_makespan(list(ch), instance) for ch in population], dtype=float)
+    pop = np.asarray(population, dtype=np.intp)
+    if pop.ndim != 2:
+        raise ValueError("population must be a 2-D array of operation ids")
+    n_pop, n_genes = pop.shape
+    if n_genes == 0:
+        return np.full(n_pop, np.inf)
+
+    base = np.arange(n_pop, dtype=np.intp)
+    # Flat indices into the (n_pop, num_jobs) / (n_pop, num_machines) state,
+    # laid out position-major so each step reads one contiguous row.
+    job_idx = np.ascontiguousarray((base[:, None] * instance.num_jobs + instance.op_job_array[pop]).T)
+    machine_idx = np.ascontiguousarray((base[:, None] * instance.num_machines + instance.op_machine_array[pop]).T)
+    durations = np.ascontiguousarray(instance.op_duration_array[pop].T)
+
+    job_ready = np.zeros(n_pop * instance.num_jobs)
+    machine_ready = np.zeros(n_pop * instance.num_machines)
+    for k in range(n_genes):
+        ji, mi = job_idx[k], machine_idx[k]
+        end = np.maximum(job_ready[ji], machine_ready[mi]) + durations[k]
+        job_ready[ji] = end
+        machine_ready[mi] = end
+    return job_ready.reshape(n_pop, instance.num_jobs).max(axis=1)
+
+
+def _simulate(ops, instance, job_times, machine_times, makespan):
+    """Continue a semi-active decode of ``ops`` from the given state (mutated in place)."""
+    op_job, op_machine, op_duration = instance.op_job, instance.op_machine, instance.op_duration
+    for op in ops:
+        j, m = op_job[op], op_machine[op]
+        start_time = job_times[j]
+        if machine_times[m] > start_time:
+            start_time = machine_times[m]
+        end_time = start_time + op_duration[op]
+        job_times[j] = end_time
+        machine_times[m] = end_time
+        if end_time > makespan:
+            makespan = end_time
+    return makespan
+
+
+def _swapped_suffix(chromosome, i, j):
+    return [chromosome[j]] + chromosome[i + 1:j] + [chromosome[i]] + chromosome[j + 1:]
+
+
+def swap_makespans(chromosome, moves, instance):
+    """Makespans of ``chromosome`` with each ``(i, j)`` swap in ``moves`` applied.
+
+    Moves are scored against one forward pass over the shared prefix: the
+    decode state is advanced to each move's first position once, and only
+    the suffix from there is re-simulated per move.
+    """
+    chromosome = list(chromosome)
+    if not chromosome:
+        return [float('inf')] * len(moves)
+    job_times = [0.0] * instance.num_jobs
+    machine_times = [0.0] * instance.num_machines
+    makespan = 0.0
+    pos = 0
+    pending = sorted(
+        (min(a, b), max(a, b), k) for k, (a, b) in enumerate(moves)
+    )
+    results = [None] * len(moves)
+    for i, j, k in pending:
+        makespan = _simulate(chromosome[pos:i], instance, job_times, machine_times, makespan)
+        pos = i
+        if i == j:
+            results[k] = _simulate(chromosome[i:], instance, job_times[:], machine_times[:], makespan)
+        else:
+            results[k] = _simulate(_swapped_suffix(chromosome, i, j), instance,
+                                   job_times[:], machine_times[:], makespan)
+    return results
@@ -0,0 +1,145 @@
+import random
+from bisect import insort
+from itertools import count
+
+from .instance import compile_instance
+from .fitness import FitnessCache, evaluate_population
+from .history import make_history
+from .stopping import StoppingRule
+from .chromosome import generate_population
+from .dispatching import RULES
+from .operators import CROSSOVERS, individual_mutate
+from .ga import _check_fitness_decoder
+
+__all__ = ["SteadyStatePopulation", "steady_state_genetic_algorithm"]
+
+
+class SteadyStatePopulation:
+    """Population kept sorted by makespan, with a hash set of its members.
+
+    Entries are ``(makespan, tiebreak, chromosome)``; the best is at index 0
+    and the worst at the end, so replacing the worst is a ``pop`` plus one
+    ``insort``. Chromosomes already present are never admitted.
+    """
+
+    def __init__(self, chromosomes, scores):
+        self._tick = count()
+        self.ranked = []
+        self.members = set()
+        for chromosome, value in zip(chromosomes, scores):
+            key = tuple(chromosome)
+            if key in self.members:
+                continue
+            self.members.add(key)
+            insort(self.ranked, (value, next(self._tick), list(chromosome)))
+        self.size = len(self.ranked)
+
+    def __len__(self):
+        return len(self.ranked)
+
+    def __contains__(self, chromosome):
+        return tuple(chromosome) in self.members
+
+    @property
+    def best(self):
+        return self.ranked[0]
+
+    @property
+    def worst(self):
+        return self.ranked[-1]
+
+    def tournament(self, size=2):
+        """Parent by tournament: the best-ranked of ``size`` random members."""
+        return self.ranked[min(random.randrange(len(self.ranked)) for _ in range(size))][2]
+
+    def offer(self, chromosome, value):
+        """Insert ``chromosome`` over the worst member if it is new and better."""
+        key = tuple(chromosome)
+        if key in self.members:
+            return False
+        if len(self.ranked) >= self.size and value >= self.ranked[-1][0]:
+            return False
+        if len(self.ranked) >= self.size:
+            _, _, removed = self.ranked.pop()
+            self.members.discard(tuple(removed))
+        self.members.add(key)
+        insort(self.ranked, (value, next(self._tick), list(chromosome)))
+        return True
+
+    def chromosomes(self):
+        return [chromosome for _, _, chromosome in self.ranked]
+
+
+def steady_state_genetic_algorithm(machines, processing_times, order, population_size, generations,
+                                   mutation_rate, instance=None, fitness=None, mutation_tries=1,
+                                   crossover="one_point", history=None, stop=None,
+                                   decoder="semi_active", neighborhood=None, seed_fraction=0.0,
+                                   seed_rules=RULES, steps_per_generation=None, tournament_size=2,
+                                   checkpoint=None, resume=False):
+    """Steady-state GA; returns the same tuple as ``genetic_algorithm``.
+
+    Each step picks parents by tournament and makes one mutant (with
+    probability ``mutation_rate``) or two crossover children. Only those
+    children are evaluated, and each replaces the current worst member if
+    it is better and not already in the population. A "generation" for
+    ``generations``, ``stop`` and the history is ``steps_per_generation``
+    steps (default ``population_size // 2``, about one population of
+    children). ``checkpoint``/``resume`` work as in ``genetic_algorithm``.
+    """
+    if instance is None:
+        instance = compile_instance(machines, processing_times)
+    if fitness is None:
+        fitness = FitnessCache(instance, decoder=decoder)
+    _check_fitness_decoder(fitness, decoder)
+    if crossover not in CROSSOVERS:
+        raise ValueError(f"Unknown crossover: {crossover} (expected one of {sorted(CROSSOVERS)})")
+    history = make_history(instance, history, decoder)
+    if stop is None:
+        stop = StoppingRule(generations=generations)
+    elif stop.generations is None:
+        stop.generations = generations
+    if not stop.bounded():
+        raise ValueError("GA needs generations, time_limit or max_stagnation "
+                         "(or a callback with callback_bounds=True)")
+    if steps_per_generation is None:
+        steps_per_generation = max(1, population_size // 2)
+    stop.start()
+
+    makespan_history = []
+    generation = 0
+    if resume and checkpoint is not None and checkpoint.exists():
+        state = checkpoint.load(instance)
+        # Saved in rank order, so rebuilding keeps the tie order as well.
+        population = SteadyStatePopulation(state["population"], state["scores"])
+        checkpoint.restore(state, history, stop)
+        makespan_history = state["makespan_history"]
+        generation = state["generation"]
+    else:
+        initial = generate_population(instance, order, population_size, seed_fraction, seed_rules)
+        population = SteadyStatePopulation(initial, evaluate_population(initial, instance, fitness))
+    cross = CROSSOVERS[crossover]
+
+    while not stop.exhausted():
+        for _ in range(steps_per_generation):
+            if len(population) < 2 or random.random() < mutation_rate:
+                parent = population.tournament(tournament_size)
+                children = [individual_mutate(parent, instance, fitness, mutation_tries, neighborhood)]
+            else:
+                p1 = population.tournament(tournament_size)
+                p2 = population.tournament(tournament_size)
+                children = cross(p1, p2, instance)
+            for child in children:
+                if child not in population:
+                    population.offer(child, fitness(child))
+
+        value, _, best = population.best
+        makespan_history.append(value)
+        history.record(generation, best, value)
+        stop.update(generation, best, value)
+        if checkpoint is not None and checkpoint.due(generation):
+            checkpoint.save(instance, generation + 1, population.chromosomes(),
+                            [v for v, _, _ in population.ranked], makespan_history, history, stop)
+        generation += 1
+
+    value, _, best = population.best
+    return list(best), value, makespan_history, history.finish()
@@ -0,0 +1,106 @@
+import time
+
+__all__ = ["StoppingRule"]
+
+
+class StoppingRule:
+    """Anytime stopping criteria for the GA loops.
+
+    Any combination may be set; the first one met ends the run and is kept
+    in ``reason``:
+
+    * ``generations`` - maximum number of generations (``None`` or 0 = unbounded,
+      as ``--gen 0`` on the command line)
+    * ``time_limit`` - wall-clock seconds since :meth:`start`
+    * ``target_makespan`` - stop once the incumbent is at or below it
+    * ``max_stagnation`` - generations in a row without improvement
+    * ``lower_bound`` - stop once the incumbent reaches a proven bound
+
+    ``callback(stats)`` is called after every generation with a dict holding
+    the generation, incumbent makespan and chromosome, the generation's best
+    makespan, elapsed seconds and the stagnation count. Returning ``True``
+    from it stops the run.
+
+    Only ``generations``, ``time_limit`` and ``max_stagnation`` are sure to
+    end a run (:meth:`bounded`): a target or lower bound may never be
+    reached. A callback counts as well only with ``callback_bounds=True``,
+    i.e. when the caller promises it eventually returns ``True``.
+    """
+
+    def __init__(self, generations=None, time_limit=None, target_makespan=None,
+                 max_stagnation=None, lower_bound=None, callback=None, tolerance=1e-9,
+                 callback_bounds=False):
+        self.generations = generations or None
+        self.time_limit = time_limit
+        self.target_makespan = target_makespan
+        self.max_stagnation = max_stagnation
+        self.lower_bound = lower_bound
+        self.callback = callback
+        self.tolerance = tolerance
+        self.callback_bounds = callback_bounds
+        self.start()
+
+    def start(self):
+        self.started = time.perf_counter()
+        self.reason = None
+        self.best_makespan = float('inf')
+        self.best_chromosome = None
+        self.stagnation = 0
+        self.completed = 0
+        return self
+
+    def bounded(self):
+        """True if some criterion is guaranteed to end the run."""
+        if self.callback is not None and self.callback_bounds:
+            return True
+        return any(v is not None for v in (self.generations, self.time_limit, self.max_stagnation))
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def out_of_time(self):
+        return self.time_limit is not None and self.elapsed >= self.time_limit
+
+    def exhausted(self):
+        """True if no further generation should start."""
+        if self.reason is not None:
+            return True
+        if self.generations is not None and self.completed >= self.generations:
+            self.reason = "generations"
+        elif self.out_of_time():
+            self.reason = "time_limit"
+        return self.reason is not None
+
+    def update(self, generation, chromosome, makespan):
+        """Account for one finished generation; returns the stop reason or ``None``."""
+        self.completed = generation + 1
+        if makespan < self.best_makespan:
+            self.best_makespan = makespan
+            self.best_chromosome = list(chromosome)
+            self.stagnation = 0
+        else:
+            self.stagnation += 1
+
+        if self.callback is not None:
+            stats = {
+                "generation": generation,
+                "best_makespan": self.best_makespan,
+                "best_chromosome": self.best_chromosome,
+                "generation_makespan": makespan,
+                "elapsed": self.elapsed,
+                "stagnation": self.stagnation,
+            }
+            if self.callback(stats):
+                self.reason = "callback"
+                return self.reason
+
+        if self.lower_bound is not None and self.best_makespan <= self.lower_bound + self.tolerance:
+            self.reason = "lower_bound"
+        elif self.target_makespan is not None and self.best_makespan <= self.target_makespan:
+            self.reason = "target_makespan"
+        elif self.max_stagnation is not None and self.stagnation >= self.max_stagnation:
+            self.reason = "stagnation"
+        else:
+            self.exhausted()
+        return self.reason
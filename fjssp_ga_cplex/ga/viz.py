@@ -1,8 +1,8 @@
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
-from matplotlib.offsetbox import AnchoredText
 
 from .gene import parse_gene 
+from .instance import compile_instance
 from .schedule import get_operation_details
 
 __all__ = [
@@ -10,6 +10,9 @@ __all__ = [
     "plot_gantt_chart",
     "animate_gantt_and_makespan",
     "chromosome_gantt_chart",
+    "schedule_gantt_chart",
+    "save_animation",
+    "check_animation_writer",
 ]
 
 
@@ -62,45 +65,235 @@ def plot_gantt_chart(operation_details, ax, job_colors, show_xlabel=True):
     ax.set_title("Gantt Chart")
 
 
-def animate_gantt_and_makespan(details_history, makespan_history, color_map, num_generations: int):
+def _job_key(gene):
+    try:
+        j, o = parse_gene(gene)
+        return f"J{j}", f"O{o}"
+    except Exception:
+        return "J?", "O?"
+
+
+def _frame_geometry(operation_details, job_keys):
+    """Bar outlines per job and bar centres, in ``operation_details`` order."""
+    verts = {job: [] for job in job_keys}
+    centres = []
+    for gene, machine, start, end, _ in operation_details:
+        job, _ = _job_key(gene)
+        lo, hi = machine - 0.4, machine + 0.4
+        verts.setdefault(job, []).append(((start, lo), (start, hi), (end, hi), (end, lo)))
+        centres.append((gene, (start + end) / 2.0, machine))
+    return verts, centres
+
+
+def _blitted_frames(fig, update, artists, num_frames):
+    """RGBA frames rendered off-screen: the static figure is drawn once and
+    each frame only restores it and redraws the animated ``artists``."""
+    import numpy as np
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    original = fig.canvas
+    canvas = FigureCanvasAgg(fig)
+    try:
+        canvas.draw()
+        background = canvas.copy_from_bbox(fig.bbox)
+        for frame in range(num_frames):
+            canvas.restore_region(background)
+            update(frame)
+            for artist in artists:
+                fig.draw_artist(artist)
+            yield np.asarray(canvas.buffer_rgba())
+    finally:
+        fig.set_canvas(original)
+
+
+def _write_gif(frames, path, fps):
+    """Encode ``frames`` into a looping GIF one at a time, so only the
+    current frame is held in memory (Pillow's ``save_all`` buffers them all).
+    Each frame keeps its own adaptive palette as a local color table."""
+    from PIL import GifImagePlugin, Image
+
+    duration = max(1, round(1000 / fps))
+    fp = None
+    try:
+        for frame in frames:
+            image = Image.fromarray(frame).convert("RGB").convert("P", palette=Image.ADAPTIVE)
+            if fp is None:
+                fp = open(path, "wb")
+                header, _ = GifImagePlugin.getheader(image, info={"loop": 0, "duration": duration})
+                fp.write(b"".join(header))
+            fp.write(b"".join(GifImagePlugin.getdata(image, duration=duration,
+                                                    include_color_table=True)))
+        if fp is not None:
+            fp.write(b";")
+    finally:
+        if fp is not None:
+            fp.close()
+
+
+def check_animation_writer(path):
+    """Raise RuntimeError unless ``path`` can be written (Pillow for ``.gif``, else ffmpeg).
+
+    Returns the ffmpeg executable for videos, ``None`` for GIFs.
+    """
+    if str(path).lower().endswith(".gif"):
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            raise RuntimeError(f"Saving '{path}' needs Pillow") from None
+        return None
+    import shutil
+    import matplotlib
+
+    ffmpeg = shutil.which(matplotlib.rcParams["animation.ffmpeg_path"])
+    if ffmpeg is None:
+        raise RuntimeError(f"Saving '{path}' needs ffmpeg; install it or save a .gif instead")
+    return ffmpeg
+
+
+def _write_video(frames, path, fps):
+    import subprocess
+
+    ffmpeg = check_animation_writer(path)
+    proc = None
+    try:
+        for frame in frames:
+            if proc is None:
+                height, width = frame.shape[:2]
+                proc = subprocess.Popen(
+                    [ffmpeg, "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgba",
+                     "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+                     "-vcodec", "libx264", "-pix_fmt", "yuv420p", "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+                     str(path)],
+                    stdin=subprocess.PIPE,
+                )
+            proc.stdin.write(frame.tobytes())
+    finally:
+        if proc is not None:
+            proc.stdin.close()
+            if proc.wait():
+                raise RuntimeError(f"ffmpeg failed writing '{path}'")
+
+
+def save_animation(fig, update, artists, num_frames, path, fps=10):
+    """Write a blitted animation to ``path`` (``.gif`` via Pillow, else ffmpeg) without a display."""
+    frames = _blitted_frames(fig, update, artists, num_frames)
+    if str(path).lower().endswith(".gif"):
+        _write_gif(frames, path, fps)
+    else:
+        _write_video(frames, path, fps)
+
+
+def animate_gantt_and_makespan(details_history, makespan_history, color_map, num_generations: int,
+                               save_path=None, fps=10, dpi=100, labels=None, show=None,
+                               machine_ids=None):
+    """Animate the best schedule per recorded generation next to the makespan curve.
+
+    Bars are one ``PolyCollection`` per job whose vertices are replaced each
+    frame, operation labels are created once and moved, and the legend and
+    axes limits are fixed up front, so frames are blitted instead of redrawn.
+    ``labels`` defaults to on for up to 100 operations. The machine axis
+    spans ``machine_ids`` (an instance's ``machine_ids``); without them every
+    frame is scanned, since a flexible GA can move operations between machines.
+
+    With ``save_path`` (``.gif`` via Pillow, other suffixes such as ``.mp4``
+    via ffmpeg) the frames are rendered off-screen on an Agg canvas and
+    written without a display; ``show`` then defaults to ``False`` and
+    nothing is returned.
+    """
+    from matplotlib.collections import PolyCollection
+
     if not details_history or not makespan_history:
         print("animate_gantt_and_makespan: empty input, skip.")
         return None
+    if show is None:
+        show = save_path is None
 
-    fig = plt.figure(figsize=(10,6), constrained_layout=True, dpi=100)
+    if show:
+        fig = plt.figure(figsize=(10, 6), constrained_layout=True, dpi=dpi)
+    else:
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=(10, 6), constrained_layout=True, dpi=dpi)
     gs = fig.add_gridspec(2, 1, height_ratios=[3, 2])
     ax1 = fig.add_subplot(gs[0, 0])
     ax2 = fig.add_subplot(gs[1, 0])
 
+    # A BestHistory may hold only some generations; its details are
+    # decoded on demand for the frame being drawn.
+    generations = getattr(details_history, "generations", None) or list(range(len(details_history)))
+    num_generations = min(num_generations, len(details_history))
+
+    first = details_history[0]
+    if machine_ids:
+        mmax = max(machine_ids)
+    else:
+        mmax = max(machine for details in details_history for _, machine, _, _, _ in details)
+    xmax = max(makespan_history) if makespan_history else 1.0
+    ax1.set_xlim(0, xmax * 1.02)
+    ax1.set_ylim(0.4, mmax + 0.6)
+    ax1.set_yticks(range(1, mmax + 1))
+    ax1.set_yticklabels(range(1, mmax + 1))
+    ax1.set_ylabel("Machines")
+    ax1.grid(True, axis="both", linestyle="--", alpha=0.35)
+    ax1.set_title("Gantt Chart")
+
+    job_keys = list(color_map.keys())
+    collections = {}
+    for job in job_keys:
+        coll = PolyCollection([], facecolors=color_map[job], edgecolors="none", animated=True)
+        ax1.add_collection(coll)
+        collections[job] = coll
+    handles = [plt.Rectangle((0, 0), 1, 1, color=c) for c in color_map.values()]
+    if handles:
+        leg = ax1.legend(handles, job_keys, title="Jobs", ncol=-(-len(job_keys) // 20),
+                         loc="upper right", frameon=True, fancybox=True, borderpad=0.4)
+        leg.get_frame().set_alpha(0.85)
+        leg.get_frame().set_edgecolor("0.5")
+
+    if labels is None:
+        labels = len(first) <= 100
+    texts = {}
+    if labels:
+        for gene, _, _, _, _ in first:
+            texts[gene] = ax1.text(0, 0, _job_key(gene)[1], ha="center", va="center",
+                                   color="white", animated=True)
+    caption = ax1.text(0.01, 0.97, "", transform=ax1.transAxes, ha="left", va="top",
+                       animated=True, bbox=dict(boxstyle="round,pad=0.3", fc="white", alpha=0.8))
+
+    ax2.set_xlim(0, max(len(makespan_history) - 1, 1))
+    ax2.set_ylim(0, xmax * 1.1)
+    ax2.set_title("Makespan History", pad=10)
+    ax2.set_xlabel("Generation")
+    ax2.set_ylabel("Makespan")
+    ax2.grid(True, linestyle="--", alpha=0.4)
+    (line,) = ax2.plot([], [], marker="o", animated=True)
+    current = ax2.text(0.99, 0.95, "", transform=ax2.transAxes, ha="right", va="top", animated=True,
+                       bbox=dict(boxstyle="round,pad=0.4", fc="lightgrey", ec="black"))
+
+    artists = list(collections.values()) + list(texts.values()) + [caption, line, current]
+    # Lay the figure out once; the axes do not change between frames.
+    fig.draw_without_rendering()
+    fig.set_layout_engine("none")
+
     def update(frame):
-        plot_gantt_chart(details_history[frame], ax1, color_map, show_xlabel=False)
-        ax1.set_title(f"Gantt Chart - Generation {frame + 1}")
-
-        handles = [plt.Rectangle((0, 0), 1, 1, color=c) for c in color_map.values()]
-        labels = list(color_map.keys())
-        if handles and labels:
-            leg = ax1.legend(handles, labels, title="Jobs",
-                             loc="upper right", frameon=True, fancybox=True, borderpad=0.4)
-            leg.get_frame().set_alpha(0.85)
-            leg.get_frame().set_edgecolor("0.5")
-            leg.set_draggable(True)
-
-        ax2.clear()
-        ax2.plot(makespan_history[: frame + 1], marker="o")
-        ymax = max(makespan_history) if makespan_history else 1.0
-        ax2.set_ylim(0, ymax * 1.1)
-        ax2.set_title("Makespan History", pad=10) 
-        ax2.set_xlabel("Generation")
-        ax2.set_ylabel("Makespan")
-        ax2.grid(True, linestyle="--", alpha=0.4)
-        at = AnchoredText(f"Current Makespan: {makespan_history[frame]:.2f}",
-                          loc="upper right", prop=dict(size=10), frameon=True, borderpad=0.5)
-        at.patch.set_boxstyle("round,pad=0.4")
-        at.patch.set_edgecolor("black")
-        at.patch.set_facecolor("lightgrey")
-        ax2.add_artist(at)
-
-    ani = FuncAnimation(fig, update, frames=num_generations, repeat=False)
+        gen = generations[frame]
+        verts, centres = _frame_geometry(details_history[frame], job_keys)
+        for job, coll in collections.items():
+            coll.set_verts(verts.get(job, []))
+        for gene, x, y in centres:
+            text = texts.get(gene)
+            if text is not None:
+                text.set_position((x, y))
+        caption.set_text(f"Generation {gen + 1}")
+        line.set_data(range(gen + 1), makespan_history[: gen + 1])
+        current.set_text(f"Current Makespan: {makespan_history[gen]:.2f}")
+        return artists
+
+    if save_path is not None:
+        save_animation(fig, update, artists, num_generations, save_path, fps)
+    if not show:
+        return None
+
+    ani = FuncAnimation(fig, update, frames=num_generations, repeat=False, blit=True)
     if not hasattr(animate_gantt_and_makespan, "_anims"):
         animate_gantt_and_makespan._anims = []
     animate_gantt_and_makespan._anims.append(ani)
@@ -109,10 +302,9 @@ def animate_gantt_and_makespan(details_history, makespan_history, color_map, num
     return ani
 
 
-def chromosome_gantt_chart(best_chromosome, machines, processing_times, title="Gantt Chart"):
-    operation_details = get_operation_details(best_chromosome, machines, processing_times)
+def schedule_gantt_chart(operation_details, num_jobs, title="Gantt Chart"):
+    """Gantt chart of an already decoded schedule."""
     fig, ax = plt.subplots(figsize=(10, 6))
-    num_jobs = max(len(machine) for machine in machines.values())
     from .utils import generate_color_map
     color_map = generate_color_map(num_jobs)
 
@@ -129,3 +321,11 @@ def chromosome_gantt_chart(best_chromosome, machines, processing_times, title="G
     ax.set_title(title)
     plt.tight_layout()
     plt.show()
+
+
+def chromosome_gantt_chart(best_chromosome, machines, processing_times, title="Gantt Chart",
+                           decoder="semi_active"):
+    instance = compile_instance(machines, processing_times)
+    operation_details = get_operation_details(instance.encode(best_chromosome), instance, decoder)
+    num_jobs = max(len(machine) for machine in machines.values())
+    schedule_gantt_chart(operation_details, num_jobs, title)
@@ -0,0 +1,49 @@
+import argparse
+import subprocess
+import sys
+
+# Heavy modules the solver path must not load at import time.
+FORBIDDEN = ("matplotlib", "pandas", "openpyxl", "docplex", "multiprocessing")
+
+
+def measure(module: str, runs: int = 5):
+    """Best-of-``runs`` cumulative import time (seconds) and loaded heavy modules."""
+    best = float("inf")
+    loaded = []
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {FORBIDDEN!r} if m in sys.modules))"
+    )
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True, text=True, check=True,
+        )
+        loaded = [m for m in proc.stdout.strip().split(",") if m]
+        for line in proc.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module:
+                best = min(best, int(parts[1]) / 1e6)
+    return best, loaded
+
+
+def main(module: str = "ga.mainga", budget: float = 0.35, runs: int = 5) -> int:
+    seconds, loaded = measure(module, runs)
+    print(f"[import] {module}: {seconds * 1000:.1f} ms (budget {budget * 1000:.0f} ms)")
+    ok = True
+    if loaded:
+        print(f"[FAIL] heavy modules loaded at import: {', '.join(loaded)}")
+        ok = False
+    if seconds > budget:
+        print("[FAIL] import time over budget")
+        ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the GA solver import-time budget")
+    parser.add_argument("--module", type=str, default="ga.mainga", help="Module to import")
+    parser.add_argument("--budget", type=float, default=0.35, help="Budget in seconds")
+    parser.add_argument("--runs", type=int, default=5, help="Take the best of this many runs")
+    args = parser.parse_args()
+    sys.exit(main(module=args.module, budget=args.budget, runs=args.runs))
@@ -1,19 +1,29 @@
 import argparse
 
 from cplex_solver.cplex_solver import solve_from_excel
-from ga.viz import chromosome_gantt_chart
 
 
-def main(input_file: str, bigM: float = 1e7, viz: bool = False):
+def main(input_file: str, bigM: float = 1e7, viz: bool = False, warm_start: int = 0, seed=None):
+    initial = None
+    if warm_start > 0:
+        from ga.mainga import ga_optimize
+        from ga.flexible import flexible_operation_details
+        # The MIP chooses machines too, so seed it with the flexible GA's schedule.
+        ga = ga_optimize(input_file, generations=warm_start, visualize=False, seed=seed, flexible=True)
+        print(f"[GA] Warm start makespan: {ga['best_makespan']}")
+        initial = flexible_operation_details(ga["best_chromosome"], ga["instance"])
+
     print(f"[CPLEX] Solving: {input_file}")
-    res = solve_from_excel(input_file, bigM=bigM)
+    res = solve_from_excel(input_file, bigM=bigM, initial=initial)
 
     print("==== CPLEX Result ====")
     print("Cmax:", res["Cmax"])
+    print("Model size: {variables} vars, {binary} binary, {constraints} constraints".format(**res["model_size"]))
     print(f"|X| active: {len(res['X1'])}, |Z| chosen: {len(res['Z1'])}")
 
     if viz:
         try:
+            from ga.viz import chromosome_gantt_chart
             chromosome = res["chromosome_ga"]
             machines = res["machines_chosen_ga"]
             processing_times = res["processing_times_ga"]
@@ -28,7 +38,11 @@ if __name__ == "__main__":
     parser.add_argument("--input", type=str, required=True, help="Path to Excel input file")
     parser.add_argument("--bigM", type=float, default=1e7, help="Big-M value")
     parser.add_argument("--viz", action="store_true", help="Plot Gantt Chart")
+    parser.add_argument("--warm-start", type=int, default=0,
+                        help="Run the GA for this many generations and use its best schedule as MIP start")
+    parser.add_argument("--seed", type=int, default=None, help="GA random seed for --warm-start")
     parser.add_argument("--title", type=str, default=None, help="Name of Gantt Chart")
     args = parser.parse_args()
 
-    main(input_file=args.input, bigM=args.bigM, viz=args.viz)
+    main(input_file=args.input, bigM=args.bigM, viz=args.viz,
+         warm_start=args.warm_start, seed=args.seed)
@@ -1,28 +1,110 @@
 import argparse
 from ga.mainga import ga_optimize
+from ga.dispatching import RULES
 
 
-def main(input_file=None, pop=10, gen=50, mut=0.1, visualize=False):
+def main(input_file=None, pop=10, gen=50, mut=0.1, visualize=False, cache_size=100_000,
+         workers=None, seed=None, islands=None, migration_interval=10, topology="ring",
+         mutation_tries=1, crossover="one_point", time_limit=None, target=None, patience=None,
+         lower_bound=None, decoder="semi_active", neighborhood=None, animation=None, fps=10,
+         seed_fraction=0.0, seed_rules=RULES, steady_state=False, checkpoint=None,
+         checkpoint_interval=10, resume=False, flexible=False):
     result = ga_optimize(
         data_path=input_file,
         population_size=pop,
         generations=gen,
         mutation_rate=mut,
         visualize=visualize,
+        cache_size=cache_size,
+        workers=workers,
+        seed=seed,
+        islands=islands,
+        migration_interval=migration_interval,
+        topology=topology,
+        mutation_tries=mutation_tries,
+        crossover=crossover,
+        time_limit=time_limit,
+        target_makespan=target,
+        max_stagnation=patience,
+        lower_bound=lower_bound,
+        decoder=decoder,
+        neighborhood=neighborhood,
+        animation_path=animation,
+        animation_fps=fps,
+        seed_fraction=seed_fraction,
+        seed_rules=seed_rules,
+        steady_state=steady_state,
+        checkpoint_path=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+        resume=resume,
+        flexible=flexible,
     )
     print(f"[Genetic Algorithm] Solving: {input_file}")
 
     print("==== GA Result ====")
     print("Best makespan:", result["best_makespan"])
-    print("Best chromosome:", result["best_chromosome"])
+    print(f"Stopped by {result['stop_reason']} after {result['generations_run']} generations "
+          f"({result['elapsed']:.2f}s)")
+    print("Best chromosome:", result["instance"].decode(result["best_chromosome"]))
+    stats = result["fitness_stats"]
+    if stats["hits"] or stats["misses"]:
+        print(f"Fitness cache: {stats['hits']} hits, {stats['misses']} misses "
+              f"({stats['hit_rate']:.1%} hit rate)")
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run Genetic Algorithm for FJSSP")
     parser.add_argument("--input", type=str, default=None, help="Path to Excel input (default: data/Data.xlsx)")
     parser.add_argument("--pop", type=int, default=10, help="Population size")
-    parser.add_argument("--gen", type=int, default=50, help="Number of generations")
+    parser.add_argument("--gen", type=int, default=50,
+                        help="Number of generations (0 = no limit; then --time-limit or --patience is required)")
     parser.add_argument("--mut", type=float, default=0.1, help="Mutation rate")
     parser.add_argument("--viz", action="store_true", help="Enable visualization")
+    parser.add_argument("--cache-size", type=int, default=100_000, help="Fitness cache capacity (0 disables)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for evaluation/variation")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    parser.add_argument("--islands", type=int, default=None, help="Number of islands (island-model GA)")
+    parser.add_argument("--migration-interval", type=int, default=10, help="Generations between migrations")
+    parser.add_argument("--topology", choices=["ring", "full"], default="ring", help="Migration topology")
+    parser.add_argument("--mut-tries", type=int, default=1, help="Candidate swaps scored per mutation (best-of-k)")
+    parser.add_argument("--crossover", choices=["one_point", "pox", "ox"], default="one_point",
+                        help="Crossover operator (pox/ox need no repair)")
+    parser.add_argument("--time-limit", type=float, default=None, help="Wall-clock limit in seconds")
+    parser.add_argument("--target", type=float, default=None, help="Stop at this makespan or better")
+    parser.add_argument("--patience", type=int, default=None, help="Stop after N generations without improvement")
+    parser.add_argument("--lower-bound", default=None,
+                        help="Stop when this bound is reached ('auto' = job/machine load bound)")
+    parser.add_argument("--decoder", choices=["semi_active", "active"], default="semi_active",
+                        help="Schedule decoder (active fills idle gaps on machines)")
+    parser.add_argument("--neighborhood", choices=["random", "n5", "n7"], default="random",
+                        help="Mutation moves: random same-machine swaps or critical-block swaps")
+    parser.add_argument("--save-animation", type=str, default=None,
+                        help="Write the convergence animation to this .mp4/.gif without a display")
+    parser.add_argument("--fps", type=int, default=10, help="Frames per second for --save-animation")
+    parser.add_argument("--seed-fraction", type=float, default=0.0,
+                        help="Share of the initial population built by dispatching rules")
+    parser.add_argument("--seed-rules", type=str, default=",".join(RULES),
+                        help="Comma-separated dispatching rules for --seed-fraction")
+    parser.add_argument("--steady-state", action="store_true",
+                        help="Steady-state GA: children replace the worst individual one step at a time")
+    parser.add_argument("--checkpoint", type=str, default=None, help="Checkpoint file (.npz) written during the run")
+    parser.add_argument("--checkpoint-interval", type=int, default=10, help="Generations between checkpoints")
+    parser.add_argument("--resume", action="store_true", help="Continue from --checkpoint if it exists")
+    parser.add_argument("--flexible", action="store_true",
+                        help="Also optimize the machine assignment (two-vector chromosome)")
     args = parser.parse_args()
-    main(input_file=args.input, pop=args.pop, gen=args.gen, mut=args.mut, visualize=args.viz)
+    lower_bound = args.lower_bound
+    if lower_bound not in (None, "auto"):
+        lower_bound = float(lower_bound)
+    main(input_file=args.input, pop=args.pop, gen=args.gen or None, mut=args.mut, visualize=args.viz,
+         cache_size=args.cache_size, workers=args.workers, seed=args.seed,
+         islands=args.islands, migration_interval=args.migration_interval, topology=args.topology,
+         mutation_tries=args.mut_tries, crossover=args.crossover, time_limit=args.time_limit,
+         target=args.target, patience=args.patience, lower_bound=lower_bound,
+         decoder=args.decoder,
+         neighborhood=None if args.neighborhood == "random" else args.neighborhood,
+         animation=args.save_animation, fps=args.fps,
+         seed_fraction=args.seed_fraction, seed_rules=tuple(args.seed_rules.split(",")),
+         steady_state=args.steady_state, checkpoint=args.checkpoint,
+         checkpoint_interval=args.checkpoint_interval, resume=args.resume,
+         flexible=args.flexible)
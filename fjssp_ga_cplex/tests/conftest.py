@@ -0,0 +1,18 @@
+from pathlib import Path
+
+import pytest
+
+DATA = Path(__file__).resolve().parents[1] / "data" / "Data.xlsx"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep the parsed-workbook cache out of the user's home directory."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("FJSSP_GA_CACHE_DIR", str(path))
+    return path
+
+
+@pytest.fixture
+def data_file():
+    return str(DATA)
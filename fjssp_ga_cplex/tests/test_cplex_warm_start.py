@@ -0,0 +1,26 @@
+import pytest
+
+pytest.importorskip("docplex")
+
+from cplex_solver.cplex_solver import _schedule_from_initial, solve_from_excel
+from ga.flexible import compile_flexible_instance
+from ga.gene import parse_gene
+from ga.io import read_flexible_parameters
+from ga.mainga import ga_optimize
+
+
+def test_flexible_chromosome_keeps_its_assignment(data_file):
+    best = ga_optimize(data_file, generations=5, seed=2, flexible=True)["best_chromosome"]
+    instance = compile_flexible_instance(*read_flexible_parameters(data_file))
+    schedule = _schedule_from_initial(data_file, best)
+
+    assert len(schedule) == instance.num_operations
+    for gene, machine in instance.decode(best):
+        assert schedule[parse_gene(gene)][0] == machine
+
+
+def test_flexible_warm_start_is_accepted(data_file):
+    result = ga_optimize(data_file, generations=5, seed=2, flexible=True)
+    res = solve_from_excel(data_file, initial=result["best_chromosome"])
+    assert res["warm_start_Cmax"] == pytest.approx(result["best_makespan"])
+    assert res["Cmax"] <= res["warm_start_Cmax"] + 1e-6
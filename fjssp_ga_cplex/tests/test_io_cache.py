@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+
+from ga.io import read_parameters_from_excel
+
+
+@pytest.mark.parametrize("corrupt", [
+    lambda data: b"not a zip file",
+    lambda data: data[:len(data) // 2],
+])
+def test_corrupt_cache_entry_is_rebuilt(data_file, cache_dir, corrupt):
+    expected = read_parameters_from_excel(data_file)
+    [entry] = cache_dir.glob("*.npz")
+    entry.write_bytes(corrupt(entry.read_bytes()))
+
+    assert read_parameters_from_excel(data_file) == expected
+    # The unreadable entry was replaced by a good one.
+    with np.load(entry) as data:
+        assert "eligibility" in data
+    assert read_parameters_from_excel(data_file) == expected
@@ -0,0 +1,43 @@
+import multiprocessing.pool
+
+import pytest
+
+from ga.ga import genetic_algorithm
+from ga.io import read_parameters_from_excel
+from ga.parallel import WorkerPool
+from ga.stopping import StoppingRule
+
+
+def test_error_in_loop_terminates_pool(data_file, monkeypatch):
+    pools = []
+    init = WorkerPool.__init__
+
+    def spy(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        pools.append(self)
+
+    monkeypatch.setattr(WorkerPool, "__init__", spy)
+
+    def fail(stats):
+        raise RuntimeError("stop here")
+
+    machines, processing_times, order = read_parameters_from_excel(data_file, cache=False)
+    with pytest.raises(RuntimeError, match="stop here"):
+        genetic_algorithm(machines, processing_times, order, 10, 5, 0.2, workers=2,
+                          stop=StoppingRule(generations=5, callback=fail))
+    assert len(pools) == 1
+    assert pools[0]._pool._state == multiprocessing.pool.TERMINATE
+
+
+def test_cache_size_reaches_workers(data_file, monkeypatch):
+    sizes = []
+    init = WorkerPool.__init__
+
+    def spy(self, instance, workers, seed=None, cache_size=100_000, decoder="semi_active"):
+        sizes.append(cache_size)
+        init(self, instance, workers, seed, cache_size, decoder)
+
+    monkeypatch.setattr(WorkerPool, "__init__", spy)
+    machines, processing_times, order = read_parameters_from_excel(data_file, cache=False)
+    genetic_algorithm(machines, processing_times, order, 10, 2, 0.2, workers=1, cache_size=64)
+    assert sizes == [64]
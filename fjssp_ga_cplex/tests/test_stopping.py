@@ -0,0 +1,49 @@
+import pytest
+
+from ga.ga import genetic_algorithm
+from ga.io import read_parameters_from_excel
+from ga.stopping import StoppingRule
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"generations": 10},
+    {"time_limit": 1.0},
+    {"max_stagnation": 5},
+    {"callback": lambda stats: True, "callback_bounds": True},
+])
+def test_bounded(kwargs):
+    assert StoppingRule(**kwargs).bounded()
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"generations": 0},
+    {"lower_bound": 100.0},
+    {"target_makespan": 100.0},
+    {"callback": lambda stats: False},
+])
+def test_unbounded(kwargs):
+    assert not StoppingRule(**kwargs).bounded()
+
+
+def test_lower_bound_alone_is_rejected(data_file):
+    machines, processing_times, order = read_parameters_from_excel(data_file)
+    with pytest.raises(ValueError, match="max_stagnation"):
+        genetic_algorithm(machines, processing_times, order, 10, None, 0.2,
+                          stop=StoppingRule(generations=0, lower_bound=1.0))
+
+
+def test_callback_bounds_needs_opt_in(data_file):
+    machines, processing_times, order = read_parameters_from_excel(data_file)
+    calls = []
+
+    def enough(stats):
+        calls.append(stats["generation"])
+        return len(calls) == 3
+
+    with pytest.raises(ValueError):
+        genetic_algorithm(machines, processing_times, order, 10, None, 0.2,
+                          stop=StoppingRule(callback=enough))
+    stop = StoppingRule(callback=enough, callback_bounds=True)
+    genetic_algorithm(machines, processing_times, order, 10, None, 0.2, stop=stop)
+    assert calls == [0, 1, 2] and stop.reason == "callback"
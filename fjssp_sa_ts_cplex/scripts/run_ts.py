@@ -10,11 +10,13 @@ def main():
     p.add_argument("--data", required=True)
     p.add_argument("--max-iter", type=int, default=300)
     p.add_argument("--tabu", type=int, default=7)
+    p.add_argument("--workers", type=int, default=None, help="processes for neighborhood evaluation")
     p.add_argument("--plot", action="store_true")
     args = p.parse_args()
 
     machines, jobs = load_data_from_excel(args.data)
-    best_jobs, best_machines, hist = tabu_search(jobs, machines, args.max_iter, args.tabu)
+    best_jobs, best_machines, hist = tabu_search(jobs, machines, args.max_iter, args.tabu,
+                                              workers=args.workers)
 
     print("Best Cmax:", objective_makespan(best_machines))
     print_schedule((best_jobs, best_machines))
@@ -1,11 +1,71 @@
+from bisect import bisect_left, bisect_right, insort
 from typing import List, Tuple, Dict, Optional
 
+
+class CapacityProfile:
+    """Tool usage over time as a skyline of sorted breakpoints.
+
+    ``usage[i]`` tools are in use on ``[times[i], times[i+1])``; usage is 0
+    before the first breakpoint and from the last one on. Windows are
+    located by bisection, so a query only touches the breakpoints inside it.
+    """
+
+    def __init__(self):
+        self.times: List[float] = []
+        self.usage: List[int] = []
+
+    def clear(self) -> None:
+        self.times.clear()
+        self.usage.clear()
+
+    def _split(self, t: float) -> int:
+        i = bisect_left(self.times, t)
+        if i == len(self.times) or self.times[i] != t:
+            self.times.insert(i, t)
+            self.usage.insert(i, self.usage[i - 1] if i > 0 else 0)
+        return i
+
+    def add(self, start: float, end: float, tools: int) -> None:
+        if end <= start:
+            return
+        i = self._split(start)
+        k = self._split(end)
+        for x in range(i, k):
+            self.usage[x] += tools
+
+    def peak(self, start: float, end: float) -> int:
+        """Largest usage on ``[start, end)`` (the usage at ``start`` if empty)."""
+        lo = bisect_right(self.times, start) - 1
+        hi = max(bisect_left(self.times, end), lo + 1)
+        return max(self.usage[max(lo, 0):hi], default=0)
+
+    def earliest_start(self, tools: int, t: float, duration: float, capacity: int) -> Optional[float]:
+        """Earliest ``s >= t`` with ``tools`` free on all of ``[s, s + duration)``.
+
+        Each blocking segment moves ``s`` to its end, so the scan never
+        revisits a breakpoint. ``None`` if ``tools`` exceeds ``capacity``.
+        """
+        if tools > capacity:
+            return None
+        limit = capacity - tools
+        times, usage = self.times, self.usage
+        s = t
+        j = max(bisect_right(times, s) - 1, 0)
+        while j < len(times) and times[j] < s + duration:
+            if usage[j] > limit:
+                # The last segment is always empty, so times[j + 1] exists.
+                s = times[j + 1]
+            j += 1
+        return s
+
+
 class Machine:
     def __init__(self, name: str, capacity: int):
         self.name = name
         self.capacity = capacity
         self.schedule: List[Tuple[float, float, int]] = []
         self.operations: List[Tuple[str, float, float]] = []
+        self.profile = CapacityProfile()
 
     def next_available_time(self) -> float:
         return self.schedule[-1][1] if self.schedule else 0.0
@@ -13,17 +73,18 @@ class Machine:
     def can_allocate(self, tools_needed: int, start_time: float, duration: float) -> bool:
         if tools_needed is None:
             return False
-        end_time = start_time + duration
-        current = 0
-        for (s, e, t) in self.schedule:
-            if not (end_time <= s or start_time >= e):
-                current += t
-        return (current + tools_needed) <= self.capacity
+        return self.profile.peak(start_time, start_time + duration) + tools_needed <= self.capacity
+
+    def earliest_start(self, tools_needed: int, ready: float, duration: float) -> Optional[float]:
+        """Earliest start ``>= ready`` at which ``tools_needed`` fit for ``duration``."""
+        if tools_needed is None:
+            return None
+        return self.profile.earliest_start(tools_needed, ready, duration, self.capacity)
 
     def allocate(self, tools_needed: int, start_time: float, duration: float) -> bool:
         if self.can_allocate(tools_needed, start_time, duration):
-            self.schedule.append((start_time, start_time + duration, tools_needed))
-            self.schedule.sort()
+            insort(self.schedule, (start_time, start_time + duration, tools_needed))
+            self.profile.add(start_time, start_time + duration, tools_needed)
             return True
         return False
 
@@ -33,6 +94,7 @@ class Machine:
     def clear(self) -> None:
         self.schedule.clear()
         self.operations.clear()
+        self.profile.clear()
 
 
 class Operation:
@@ -1,10 +1,10 @@
 from __future__ import annotations
 import random, sys
 from typing import Dict, Iterable, List, Optional, TextIO, Tuple
-from .models import Job, Machine, Operation
+from .models import Job, Machine
 
 OperationKey = Tuple[str, int]
-__all__ = ["schedule_operations", "objective_makespan",
+__all__ = ["schedule_operations", "SchedulingContext", "objective_makespan",
            "collect_machine_sequences", "print_machine_schedules"]
 
 # ---------- small utils ----------
@@ -27,23 +27,38 @@ def collect_machine_sequences(machines: Iterable[Machine]) -> Dict[str, List[Ope
         if ops: seq[m.name] = ops
     return seq
 
-def _candidates(op: Operation, machines: Iterable[Machine], ready: float) -> List[Tuple[Machine, float]]:
-    total = op.setup_time + op.time_required
-    out: List[Tuple[Machine, float]] = []
-    for m in machines:
-        tools = op.tool_requirements.get(m.name)
-        if tools is None: continue
-        start = max(ready, m.next_available_time())
-        if m.can_allocate(tools, start, total): out.append((m, start))
-    return out
+class SchedulingContext:
+    """Per-instance tables for :func:`schedule_operations`, built once.
 
-def _peek_pref(msq: Dict[str, List[OperationKey]], key: OperationKey) -> Optional[str]:
-    for m, seq in msq.items():
-        if seq and seq[0] == key: return m
-    return None
+    ``steps`` lists the operations in scheduling order (the first operation
+    of every job, then the second, ...) as ``(job, key, bar name, total
+    time, eligible)``, where ``eligible`` holds ``(machine index, tools)``
+    for the machines in ``op.tool_requirements`` only.
+    """
+    def __init__(self, jobs: List[Job], machines: List[Machine]):
+        self.machine_names = [m.name for m in machines]
+        self.steps: List[Tuple[str, OperationKey, str, float, List[Tuple[int, int]]]] = []
+        max_ops = max((len(j.operations) for j in jobs), default=0)
+        for k in range(max_ops):
+            for j in jobs:
+                op = j.get_operation(k)
+                if op is None: continue
+                key: OperationKey = (j.job_name, op.operation_id)
+                elig = [(i, op.tool_requirements[n]) for i, n in enumerate(self.machine_names)
+                        if n in op.tool_requirements]
+                self.steps.append((j.job_name, key, _fmt_op(*key), op.setup_time + op.time_required, elig))
+        self.key_of_name: Dict[str, OperationKey] = {name: key for _, key, name, _, _ in self.steps}
 
-def _consume(msq: Dict[str, List[OperationKey]], m: str, key: OperationKey) -> None:
-    if msq.get(m) and msq[m][0] == key: msq[m].pop(0)
+    def machine_sequences(self, machines: Iterable[Machine]) -> List[List[OperationKey]]:
+        """Operation keys booked on each machine, in machine order."""
+        seqs: List[List[OperationKey]] = []
+        for m in machines:
+            seq = []
+            for (n, *_ ) in m.operations:
+                key = self.key_of_name.get(n) or _split_op(n)
+                if key[0] is not None and key[1] is not None: seq.append(key)
+            seqs.append(seq)
+        return seqs
 
 def schedule_operations(
     jobs: List[Job],
@@ -51,42 +66,52 @@ def schedule_operations(
     hints: Optional[Dict[OperationKey, str]] = None,
     use_machine_sequences: bool = True,
     randomize: bool = True,
+    context: Optional[SchedulingContext] = None,
 ) -> List[OperationKey]:
+    ctx = context or SchedulingContext(jobs, machines)
     hints = {(j, int(o)): m for (j, o), m in (hints or {}).items()}
-    msq = collect_machine_sequences(machines) if use_machine_sequences else {}
+    # Machine sequences are followed by pointer; heads maps an operation to the
+    # machines whose next preferred operation it is (the lowest index wins).
+    seqs = ctx.machine_sequences(machines) if use_machine_sequences else [[] for _ in machines]
+    pos = [0] * len(seqs)
+    heads: Dict[OperationKey, List[int]] = {}
+    for mi, seq in enumerate(seqs):
+        if seq: heads.setdefault(seq[0], []).append(mi)
     for m in machines: m.clear()
     ready = {j.job_name: 0.0 for j in jobs}
     unscheduled: List[OperationKey] = []
-    max_ops = max((len(j.operations) for j in jobs), default=0)
-    for k in range(max_ops):
-        for j in jobs:
-            op = j.get_operation(k)
-            if op is None: continue
-            key: OperationKey = (j.job_name, op.operation_id)
-
-            pref = hints.get(key) or _peek_pref(msq, key)
-            cand = _candidates(op, machines, ready[j.job_name])
-            if pref:
-                cand = [c for c in cand if c[0].name == pref] or cand
-            if not cand:
-                unscheduled.append(key); continue
+    for job_name, key, name, total, elig in ctx.steps:
+        pref = hints.get(key)
+        if not pref and key in heads:
+            pref = ctx.machine_names[min(heads[key])]
+        cand: List[Tuple[Machine, float, int, int]] = []
+        for mi, tools in elig:
+            m = machines[mi]
+            start = m.earliest_start(tools, max(ready[job_name], m.next_available_time()), total)
+            if start is not None: cand.append((m, start, mi, tools))
+        if pref:
+            cand = [c for c in cand if c[0].name == pref] or cand
+        if not cand:
+            unscheduled.append(key); continue
 
-            sel = (random.choice(cand) if (randomize and not pref and len(cand) > 1)
-                   else min(cand, key=lambda t: (t[1], t[0].name)))
-            m, start = sel
-            total = op.setup_time + op.time_required
-            tools = op.tool_requirements.get(m.name)
-            if not m.allocate(tools, start, total):
-                placed = False
-                for mm, st in sorted(cand, key=lambda t: (t[1], t[0].name)):
-                    tt = op.tool_requirements.get(mm.name)
-                    if mm.allocate(tt, st, total):
-                        m, start, tools, placed = mm, st, tt, True; break
-                if not placed: unscheduled.append(key); continue
+        sel = (random.choice(cand) if (randomize and not pref and len(cand) > 1)
+               else min(cand, key=lambda t: (t[1], t[0].name)))
+        m, start, mi, tools = sel
+        if not m.allocate(tools, start, total):
+            placed = False
+            for mm, st, mmi, tt in sorted(cand, key=lambda t: (t[1], t[0].name)):
+                if mm.allocate(tt, st, total):
+                    m, start, mi, tools, placed = mm, st, mmi, tt, True; break
+            if not placed: unscheduled.append(key); continue
 
-            end = start + total
-            m.add_operation_bar(_fmt_op(j.job_name, op.operation_id), start, end)
-            ready[j.job_name] = end
-            _consume(msq, m.name, key)
+        end = start + total
+        m.add_operation_bar(name, start, end)
+        ready[job_name] = end
+        seq = seqs[mi]
+        if pos[mi] < len(seq) and seq[pos[mi]] == key:
+            owners = heads[key]; owners.remove(mi)
+            if not owners: del heads[key]
+            pos[mi] += 1
+            if pos[mi] < len(seq): heads.setdefault(seq[pos[mi]], []).append(mi)
 
     return unscheduled
@@ -0,0 +1,98 @@
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Tuple
+from .models import Job, Machine
+from .scheduler import OperationKey, SchedulingContext, _fmt_op, objective_makespan, schedule_operations
+
+__all__ = ["Instance", "Solution"]
+
+
+class Solution:
+    """Compact schedule state: plain lists indexed by operation/machine id.
+
+    ``sequences[m]`` lists the operation ids on machine ``m`` in processing
+    order, ``assignment[op]`` is the machine of ``op`` (-1 if unscheduled)
+    and ``start``/``end`` its times. ``copy()`` only copies these lists.
+    """
+    __slots__ = ("sequences", "assignment", "start", "end", "makespan")
+
+    def __init__(self, sequences: List[List[int]], assignment: List[int],
+                 start: List[float], end: List[float], makespan: float):
+        self.sequences = sequences
+        self.assignment = assignment
+        self.start = start
+        self.end = end
+        self.makespan = makespan
+
+    def copy(self) -> "Solution":
+        return Solution([s[:] for s in self.sequences], self.assignment[:],
+                        self.start[:], self.end[:], self.makespan)
+
+
+class Instance:
+    """Read-only problem data plus one set of scratch machines for decoding.
+
+    Operations are numbered job by job in ``jobs`` order. Decoding loads a
+    :class:`Solution`'s sequences into the scratch machines as preferences,
+    runs :func:`schedule_operations` and reads the result back, so the
+    heuristics never copy ``Job``/``Machine`` object graphs.
+    """
+
+    def __init__(self, jobs: List[Job], machines: List[Machine]):
+        self.jobs = jobs
+        self.machines = [Machine(m.name, m.capacity) for m in machines]
+        self.machine_names = [m.name for m in machines]
+        self.context = SchedulingContext(jobs, self.machines)
+        self.ops = [op for j in jobs for op in j.operations]
+        self.op_keys: List[OperationKey] = [(op.job_name, op.operation_id) for op in self.ops]
+        self.op_names = [_fmt_op(j, o) for j, o in self.op_keys]
+        self.op_index: Dict[str, int] = {n: k for k, n in enumerate(self.op_names)}
+        # Operations with a machine choice, as (job, operation id, eligible machine names).
+        self.flexible_ops: List[Tuple[str, int, List[str]]] = [
+            (op.job_name, op.operation_id, elig)
+            for op in self.ops
+            for elig in [[n for n in self.machine_names if n in op.tool_requirements]]
+            if len(elig) >= 2
+        ]
+
+    @property
+    def num_operations(self) -> int:
+        return len(self.ops)
+
+    def capture(self, machines: Iterable[Machine]) -> Solution:
+        """The solution currently recorded in ``machines`` (e.g. an empty one)."""
+        n = self.num_operations
+        sequences: List[List[int]] = [[] for _ in self.machine_names]
+        assignment, start, end = [-1] * n, [0.0] * n, [0.0] * n
+        for mi, m in enumerate(machines):
+            for name, s, e in m.operations:
+                op = self.op_index.get(name)
+                if op is None:
+                    continue
+                sequences[mi].append(op)
+                assignment[op], start[op], end[op] = mi, float(s), float(e)
+        return Solution(sequences, assignment, start, end, objective_makespan(machines))
+
+    def decode(self, solution: Optional[Solution] = None,
+               hints: Optional[Dict[OperationKey, str]] = None, randomize: bool = True) -> Solution:
+        """New solution scheduled with ``solution``'s machine sequences as preferences."""
+        names = self.op_names
+        for mi, m in enumerate(self.machines):
+            if solution is None:
+                m.operations = []
+            else:
+                m.operations = [(names[op], solution.start[op], solution.end[op])
+                                for op in solution.sequences[mi]]
+        schedule_operations(self.jobs, self.machines, hints=hints, randomize=randomize,
+                            context=self.context)
+        return self.capture(self.machines)
+
+    def materialize(self, solution: Solution) -> Tuple[List[Job], List[Machine]]:
+        """``(jobs, machines)`` holding ``solution``, for printing and plotting."""
+        machines = [Machine(m.name, m.capacity) for m in self.machines]
+        for mi, m in enumerate(machines):
+            for op in solution.sequences[mi]:
+                o = self.ops[op]
+                s, e = solution.start[op], solution.end[op]
+                m.allocate(o.tool_requirements.get(m.name), s, e - s)
+                m.add_operation_bar(self.op_names[op], s, e)
+        return self.jobs, machines
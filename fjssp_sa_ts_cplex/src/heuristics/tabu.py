@@ -1,42 +1,166 @@
-import copy
-from typing import List
+import signal
+from multiprocessing import Pool
+from typing import Dict, List, Optional, Tuple
 from src.core.models import Job, Machine
-from src.core.scheduler import schedule_operations, objective_makespan
+from src.core.solution import Instance
 
-def tabu_search(jobs: List[Job], machines: List[Machine], max_iterations: int, tabu_tenure: int):
-    best_jobs = copy.deepcopy(jobs); best_machines = copy.deepcopy(machines)
-    schedule_operations(best_jobs, best_machines)
-    best_obj = objective_makespan(best_machines)
-    current_jobs = copy.deepcopy(best_jobs); current_machines = copy.deepcopy(best_machines)
+Move = Tuple[int, int]   # (machine index, position): swap positions i and i+1
+
+class SwapEvaluator:
+    """Makespans of adjacent-swap neighbors without full re-decoding.
+
+    Replays ``schedule_operations(..., randomize=False)`` on plain arrays:
+    machine and job ready times, a pointer into every machine sequence and
+    the head index. ``trace`` records that state before every scheduling
+    step. Nothing before the first step of the two swapped operations can
+    change, so a move is re-simulated from that step only.
+    """
+    def __init__(self, instance: Instance):
+        ctx = instance.context
+        caps = [m.capacity for m in instance.machines]
+        by_name = sorted(range(len(ctx.machine_names)), key=ctx.machine_names.__getitem__)
+        self.rank = [0] * len(by_name)
+        for r, mi in enumerate(by_name): self.rank[mi] = r
+        job_index: Dict[str, int] = {}
+        self.steps: List[Tuple[int, int, float, List[int]]] = []
+        self.step_of = [0] * instance.num_operations
+        for t, (job_name, _, name, total, elig) in enumerate(ctx.steps):
+            op = instance.op_index[name]
+            self.step_of[op] = t
+            self.steps.append((job_index.setdefault(job_name, len(job_index)), op, total,
+                               [mi for mi, tools in elig if tools <= caps[mi]]))
+        self.num_jobs = len(job_index)
+        self.num_machines = len(caps)
+
+    def run(self, seqs: List[List[int]], trace: Optional[list] = None, t0: int = 0,
+            state: Optional[Tuple[List[float], List[float], List[int]]] = None) -> float:
+        """Makespan of decoding ``seqs``, from step ``t0`` and ``state`` if given."""
+        if state is None:
+            mready, jready, pos = [0.0] * self.num_machines, [0.0] * self.num_jobs, [0] * len(seqs)
+        else:
+            mready, jready, pos = (s[:] for s in state)
+        heads: Dict[int, List[int]] = {}
+        for mi, seq in enumerate(seqs):
+            if pos[mi] < len(seq): heads.setdefault(seq[pos[mi]], []).append(mi)
+        rank = self.rank
+        for t in range(t0, len(self.steps)):
+            if trace is not None: trace.append((mready[:], jready[:], pos[:]))
+            jx, op, total, elig = self.steps[t]
+            if not elig: continue
+            owners = heads.get(op)
+            pref = min(owners) if owners else -1
+            r = jready[jx]
+            if pref in elig:
+                mi = pref
+                start = mready[mi] if mready[mi] > r else r
+            else:
+                start, _, mi = min(((mready[k] if mready[k] > r else r), rank[k], k) for k in elig)
+            mready[mi] = jready[jx] = start + total
+            seq = seqs[mi]
+            if pos[mi] < len(seq) and seq[pos[mi]] == op:
+                owners.remove(mi)
+                if not owners: del heads[op]
+                pos[mi] += 1
+                if pos[mi] < len(seq): heads.setdefault(seq[pos[mi]], []).append(mi)
+        return max(mready, default=0.0)
+
+    @staticmethod
+    def moves(seqs: List[List[int]]) -> List[Move]:
+        return [(m_idx, i) for m_idx, seq in enumerate(seqs) for i in range(len(seq) - 1)]
+
+    def evaluate(self, seqs: List[List[int]], trace: list, move: Move) -> float:
+        m_idx, i = move
+        seq = seqs[m_idx][:]
+        seq[i], seq[i+1] = seq[i+1], seq[i]
+        swapped = seqs[:]; swapped[m_idx] = seq
+        t0 = min(self.step_of[seq[i]], self.step_of[seq[i+1]])
+        return self.run(swapped, t0=t0, state=trace[t0])
+
+_worker_evaluator: Optional[SwapEvaluator] = None
+
+def _init_worker(evaluator: SwapEvaluator) -> None:
+    global _worker_evaluator
+    # Ctrl-C is handled by the parent alone; it terminates the pool.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _worker_evaluator = evaluator
+
+def _evaluate_chunk(task: Tuple[List[List[int]], List[Move]]) -> List[float]:
+    seqs, moves = task
+    trace: list = []
+    _worker_evaluator.run(seqs, trace)
+    return [_worker_evaluator.evaluate(seqs, trace, mv) for mv in moves]
+
+def _evaluate_moves(evaluator: SwapEvaluator, seqs: List[List[int]], moves: List[Move],
+                    pool=None, workers: int = 1) -> List[float]:
+    """Scores of ``moves`` in order; with a pool, contiguous chunks go to the workers.
+
+    Every worker holds the evaluator from the pool initializer and gets only
+    the machine sequences and its moves, so the scores (and therefore the
+    search) do not depend on the number of workers.
+    """
+    if pool is None or len(moves) < 2 * workers:
+        trace: list = []
+        evaluator.run(seqs, trace)
+        return [evaluator.evaluate(seqs, trace, mv) for mv in moves]
+    size = -(-len(moves) // workers)
+    chunks = [(seqs, moves[k:k + size]) for k in range(0, len(moves), size)]
+    result = pool.map_async(_evaluate_chunk, chunks)
+    # Wait in short slices so a KeyboardInterrupt reaches the parent promptly.
+    while not result.ready():
+        result.wait(0.1)
+    return [obj for part in result.get() for obj in part]
+
+def _attribute(seqs: List[List[int]], move: Move) -> Tuple[int, int, int]:
+    """Tabu attribute of a swap: the machine and the unordered operation pair."""
+    m_idx, i = move
+    a, b = seqs[m_idx][i], seqs[m_idx][i+1]
+    return (m_idx, a, b) if a < b else (m_idx, b, a)
+
+def tabu_search(jobs: List[Job], machines: List[Machine], max_iterations: int, tabu_tenure: int,
+                workers: Optional[int] = None):
+    instance = Instance(jobs, machines)
+    evaluator = SwapEvaluator(instance)
+    workers = workers or 1
+    if workers <= 1:
+        return _tabu_loop(instance, evaluator, machines, max_iterations, tabu_tenure, None, 1)
+    # Leaving the block calls terminate(); workers ignore SIGINT, so on Ctrl-C the
+    # parent raises out of the wait in _evaluate_moves and the pool is torn down.
+    with Pool(workers, initializer=_init_worker, initargs=(evaluator,)) as pool:
+        return _tabu_loop(instance, evaluator, machines, max_iterations, tabu_tenure, pool, workers)
+
+def _tabu_loop(instance: Instance, evaluator: SwapEvaluator, machines: List[Machine],
+               max_iterations: int, tabu_tenure: int, pool, workers: int):
+    best = instance.decode(instance.capture(machines))
+    best_obj = best.makespan
+    current = best
     current_obj = best_obj
-    tabu = []
+    # Attribute -> last move count at which it is still tabu.
+    tabu: Dict[Tuple[int, int, int], int] = {}
+    n_moves = 0
     history = [best_obj]
     for _ in range(max_iterations):
-        schedule_operations(current_jobs, current_machines)
-        neighbors = []
-        for m_idx, m in enumerate(current_machines):
-            if len(m.operations) > 1:
-                for i in range(len(m.operations)-1):
-                    nj = copy.deepcopy(current_jobs); nm = copy.deepcopy(current_machines)
-                    nm[m_idx].operations[i], nm[m_idx].operations[i+1] = nm[m_idx].operations[i+1], nm[m_idx].operations[i]
-                    schedule_operations(nj, nm)
-                    neighbors.append((nj, nm, (m_idx, i, i+1)))
-        if not neighbors:
+        current = instance.decode(current)
+        seqs = current.sequences
+        moves = evaluator.moves(seqs)
+        if not moves:
             history.append(best_obj); continue
         bestN = None; bestNobj = float('inf')
-        for nj, nm, mv in neighbors:
-            obj = objective_makespan(nm)
-            if mv not in tabu or obj < best_obj:
+        for mv, obj in zip(moves, _evaluate_moves(evaluator, seqs, moves, pool, workers)):
+            if tabu.get(_attribute(seqs, mv), -1) < n_moves or obj < best_obj:
                 if obj < bestNobj:
-                    bestN, bestNobj = (nj, nm, mv), obj
+                    bestN, bestNobj = mv, obj
         if bestN is None:
             history.append(best_obj); continue
-        current_jobs, current_machines, mv = bestN
-        current_obj = bestNobj
-        tabu.append(mv)
-        if len(tabu) > tabu_tenure:
-            tabu.pop(0)
+        tabu[_attribute(seqs, bestN)] = n_moves + tabu_tenure
+        n_moves += 1
+        m_idx, i = bestN
+        cand = current.copy()
+        s = cand.sequences[m_idx]
+        s[i], s[i+1] = s[i+1], s[i]
+        current = instance.decode(cand, randomize=False)
+        current_obj = current.makespan
         if current_obj < best_obj:
-            best_jobs, best_machines, best_obj = copy.deepcopy(current_jobs), copy.deepcopy(current_machines), current_obj
+            best, best_obj = current, current_obj
         history.append(best_obj)
+    best_jobs, best_machines = instance.materialize(best)
     return best_jobs, best_machines, history